@@ -0,0 +1,113 @@
+# guardrail_engine/batcher.py
+import asyncio
+import json
+from typing import Any
+
+from agents import Agent, Runner
+from pydantic import BaseModel, create_model
+
+BATCH_INSTRUCTIONS = """
+
+You will receive a JSON array of items, each with an "id" and a "text".
+Judge every item on its own and return "verdicts" with exactly one verdict per item,
+each carrying the "id" of the item it is about."""
+
+
+class GuardrailBatcher:
+    """Collects concurrent classifications for one guardrail agent and sends them as a single call.
+
+    A batch is flushed after `max_wait_ms` or as soon as `max_batch_size` items are waiting.
+    Verdicts are matched to items by id; if any id is missing, duplicated or unknown the batch
+    falls back to one call per item.
+    """
+
+    def __init__(self, agent: Agent[Any], max_batch_size: int = 16, max_wait_ms: float = 5.0):
+        self.agent = agent
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+
+        output_type = agent.output_type
+        self.output_type = output_type
+        item_type = create_model(f"{output_type.__name__}Item", __base__=output_type, id=(int, ...))
+        self.batch_output_type = create_model(
+            f"{output_type.__name__}Batch", verdicts=(list[item_type], ...)
+        )
+        self.batch_agent = agent.clone(
+            name=f"{agent.name}Batch",
+            instructions=f"{agent.instructions}{BATCH_INSTRUCTIONS}",
+            output_type=self.batch_output_type,
+        )
+
+        self._pending: list[tuple[str, asyncio.Future]] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._tasks: set[asyncio.Task] = set()
+
+        self.requests = 0
+        self.batches = 0
+        self.model_calls = 0
+        self.fallbacks = 0
+
+    async def classify(self, text: str) -> BaseModel:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((text, future))
+        self.requests += 1
+
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_wait, self._flush)
+
+        return await future
+
+    def stats(self) -> dict[str, float]:
+        return {
+            "requests": self.requests,
+            "batches": self.batches,
+            "model_calls": self.model_calls,
+            "fallbacks": self.fallbacks,
+            "avg_batch_size": self.requests / self.batches if self.batches else 0.0,
+        }
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._pending:
+            return
+
+        batch, self._pending = self._pending, []
+        self.batches += 1
+        task = asyncio.ensure_future(self._run_batch(batch))
+        # Keep a reference so the task isn't garbage collected mid-flight
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run_batch(self, batch: list[tuple[str, asyncio.Future]]) -> None:
+        try:
+            verdicts = await self._classify_batch([text for text, _ in batch])
+        except Exception as ex:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(ex)
+            return
+
+        for (_, future), verdict in zip(batch, verdicts):
+            if not future.done():
+                future.set_result(verdict)
+
+    async def _classify_batch(self, texts: list[str]) -> list[BaseModel]:
+        if len(texts) > 1:
+            payload = json.dumps([{"id": i, "text": text} for i, text in enumerate(texts)])
+            self.model_calls += 1
+            result = await Runner.run(self.batch_agent, payload)
+            verdicts = result.final_output.verdicts
+            by_id = {verdict.id: verdict for verdict in verdicts}
+            # Every item exactly once, otherwise a caller could get another caller's verdict
+            if len(verdicts) == len(texts) and set(by_id) == set(range(len(texts))):
+                return [self.output_type(**by_id[i].model_dump(exclude={"id"})) for i in range(len(texts))]
+            self.fallbacks += 1
+
+        self.model_calls += len(texts)
+        results = await asyncio.gather(*(Runner.run(self.agent, text) for text in texts))
+        return [result.final_output for result in results]
@@ -0,0 +1,123 @@
+# guardrail_engine/politics_prefilter.py
+import re
+from dataclasses import dataclass, field
+from typing import Literal
+
+# Terms that on their own mean the text is about politics
+STRONG_TERMS = [
+    "politics", "political", "politician", "election", "elections", "electoral", "parliament",
+    "parliamentary", "senator", "prime minister", "chief minister", "national assembly",
+    "political party", "opposition leader", "democrat", "democrats", "republican", "republicans",
+    "pml-n", "bjp", "imran khan", "nawaz sharif", "shehbaz sharif", "maryam nawaz",
+    "bilawal bhutto", "asif zardari", "benazir bhutto", "donald trump", "joe biden", "kamala harris",
+    "barack obama", "narendra modi", "vladimir putin", "xi jinping", "rishi sunak", "keir starmer",
+    # Figures are usually named by surname alone ("Trump won", "Putin and Zelensky met")
+    "biden", "obama", "putin", "zelensky", "zelenskyy", "netanyahu", "erdogan", "macron",
+    "trudeau", "jinping", "sunak", "starmer", "zardari", "bilawal", "shehbaz", "kremlin",
+    "downing street", "taliban", "hamas",
+]
+
+# Terms that only hint at politics and need company (or the LLM) to decide
+WEAK_TERMS = [
+    "president", "government", "minister", "ministry", "vote", "votes", "voting", "campaign",
+    "policy", "policies", "democracy", "dictator", "regime", "congress", "senate", "cabinet",
+    "protest", "protests", "sanctions", "referendum", "legislation", "constitution", "war",
+    "diplomacy", "embassy", "ballot", "left-wing", "right-wing", "liberal", "conservative",
+    # Political names that are also everyday words or acronyms ("ppp" is purchasing power parity,
+    # "trump" a card game), so one of them alone never blocks locally
+    "pti", "ppp", "nato", "trump", "modi", "kamala", "white house",
+]
+
+STRONG_WEIGHT = 0.9
+WEAK_WEIGHT = 0.35
+
+# Text is only declared safe locally when it is plainly math: numbers, operators and these words
+MATH_WORDS = {
+    "the", "a", "an", "answer", "result", "is", "are", "equals", "equal", "to", "so", "and", "of",
+    "plus", "minus", "times", "multiplied", "divided", "by", "over", "sum", "difference",
+    "product", "quotient", "square", "root", "cube", "squared", "cubed", "power", "sqrt", "pi",
+    "x", "y", "z", "n", "therefore", "gives", "remainder", "percent", "total",
+}
+WORD_RE = re.compile(r"[a-z]+", re.IGNORECASE)
+MATH_SIGNAL_RE = re.compile(r"[0-9=+*/^%-]")
+
+Label = Literal["safe", "unsafe", "uncertain"]
+
+
+@dataclass
+class PrefilterResult:
+    label: Label
+    score: float
+    confidence: float
+    hits: list[str] = field(default_factory=list)
+
+
+class PoliticsPrefilter:
+    """Cheap local scorer that settles obvious cases before the NoPoliticsOutput agent is asked"""
+
+    def __init__(
+        self,
+        strong_terms: list[str] = STRONG_TERMS,
+        weak_terms: list[str] = WEAK_TERMS,
+        safe_threshold: float = 0.0,
+        unsafe_threshold: float = 0.85,
+        max_safe_chars: int = 600,
+    ):
+        self.safe_threshold = safe_threshold
+        self.unsafe_threshold = unsafe_threshold
+        self.max_safe_chars = max_safe_chars
+
+        self._weights = {term.lower(): WEAK_WEIGHT for term in weak_terms}
+        self._weights.update({term.lower(): STRONG_WEIGHT for term in strong_terms})
+        # Longest terms first so "prime minister" wins over "minister"
+        terms = sorted(self._weights, key=len, reverse=True)
+        self._pattern = re.compile(
+            r"(?<![\w-])(?:" + "|".join(re.escape(term) for term in terms) + r")(?![\w-])",
+            re.IGNORECASE,
+        )
+
+        self.local_safe = 0
+        self.local_unsafe = 0
+        self.escalated = 0
+
+    def score(self, text: str) -> tuple[float, list[str]]:
+        hits = sorted({match.group(0).lower() for match in self._pattern.finditer(text)})
+        not_political = 1.0
+        for term in hits:
+            not_political *= 1.0 - self._weights[term]
+        return 1.0 - not_political, hits
+
+    def classify(self, text: str) -> PrefilterResult:
+        score, hits = self.score(text)
+        # 1.0 at either end of the scale, 0.0 when the lexicon can't tell at all
+        confidence = abs(2 * score - 1)
+
+        if score >= self.unsafe_threshold:
+            self.local_unsafe += 1
+            return PrefilterResult("unsafe", score, confidence, hits)
+
+        # No hits alone proves nothing (the lexicon can't know every name), so "safe" also
+        # needs positive evidence: text that is only numbers, operators and math words
+        if score <= self.safe_threshold and len(text) <= self.max_safe_chars and self.is_plain_math(text):
+            self.local_safe += 1
+            return PrefilterResult("safe", score, confidence, hits)
+
+        self.escalated += 1
+        return PrefilterResult("uncertain", score, confidence, hits)
+
+    @staticmethod
+    def is_plain_math(text: str) -> bool:
+        if not MATH_SIGNAL_RE.search(text):
+            return False
+        return all(word.lower() in MATH_WORDS for word in WORD_RE.findall(text))
+
+    def stats(self) -> dict[str, float]:
+        total = self.local_safe + self.local_unsafe + self.escalated
+        local = self.local_safe + self.local_unsafe
+        return {
+            "total": total,
+            "local_safe": self.local_safe,
+            "local_unsafe": self.local_unsafe,
+            "escalated": self.escalated,
+            "local_ratio": local / total if total else 0.0,
+        }
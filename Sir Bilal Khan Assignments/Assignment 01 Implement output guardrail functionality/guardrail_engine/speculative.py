@@ -0,0 +1,94 @@
+# guardrail_engine/speculative.py
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable
+
+from agents import (
+    Agent,
+    GuardrailFunctionOutput,
+    InputGuardrail,
+    InputGuardrailResult,
+    InputGuardrailTripwireTriggered,
+    RunHooks,
+    RunResult,
+    Runner,
+)
+
+
+@dataclass
+class SpeculationStats:
+    runs: int = 0
+    tripped: int = 0
+    cancelled_in_flight: int = 0
+    latency_saved: float = 0.0
+    tokens_wasted: int = 0
+
+
+class _TokenCounter(RunHooks):
+    """Counts tokens of every finished model call, so a cancelled run still reports what it spent"""
+
+    def __init__(self):
+        self.total_tokens = 0
+
+    async def on_llm_end(self, context, agent, response) -> None:
+        self.total_tokens += response.usage.total_tokens
+
+
+class SpeculativeRunner:
+    """Starts the agent run at the same time as its input guardrail instead of after it.
+
+    If the guardrail trips, the agent run is cancelled, its output is thrown away and
+    InputGuardrailTripwireTriggered is raised just like a normal guarded run. Otherwise
+    the already-running result is returned.
+    """
+
+    def __init__(
+        self,
+        agent: Agent[Any],
+        guardrail: InputGuardrail[Any],
+        check: Callable[[Any, Any], Awaitable[GuardrailFunctionOutput]],
+    ):
+        # The guardrail is run here, so the agent itself must not run it a second time
+        self.agent = agent.clone(input_guardrails=[])
+        self.guardrail = guardrail
+        self.check = check
+        self.stats = SpeculationStats()
+
+    async def run(self, input: Any, context: Any = None) -> RunResult:
+        self.stats.runs += 1
+        started = time.perf_counter()
+        counter = _TokenCounter()
+        agent_done_at: float | None = None
+
+        async def run_agent() -> RunResult:
+            nonlocal agent_done_at
+            result = await Runner.run(self.agent, input, context=context, hooks=counter)
+            agent_done_at = time.perf_counter()
+            return result
+
+        agent_task = asyncio.create_task(run_agent())
+        try:
+            output = await self.check(input, context)
+        except BaseException:
+            agent_task.cancel()
+            raise
+        guardrail_time = time.perf_counter() - started
+
+        if output.tripwire_triggered:
+            self.stats.tripped += 1
+            if not agent_task.done():
+                agent_task.cancel()
+                self.stats.cancelled_in_flight += 1
+            elif not agent_task.cancelled():
+                agent_task.exception()  # discarded either way, don't log it as unretrieved
+            self.stats.tokens_wasted += counter.total_tokens
+            raise InputGuardrailTripwireTriggered(
+                InputGuardrailResult(guardrail=self.guardrail, output=output)
+            )
+
+        result = await agent_task
+        # Running one after the other would have cost guardrail time + agent time
+        agent_time = agent_done_at - started
+        self.stats.latency_saved += guardrail_time + agent_time - (time.perf_counter() - started)
+        return result
@@ -0,0 +1,99 @@
+# guardrail_engine/streaming_guard.py
+import re
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable
+
+from agents import (
+    Agent,
+    GuardrailFunctionOutput,
+    OutputGuardrail,
+    OutputGuardrailResult,
+    OutputGuardrailTripwireTriggered,
+    Runner,
+)
+from openai.types.responses import ResponseTextDeltaEvent
+
+# A segment is ready to be checked once it ends a sentence or a line
+SEGMENT_END = re.compile(r"[.!?;:\n]\s*$")
+
+
+@dataclass
+class StreamGuardMetrics:
+    time_to_first_token: float | None = None
+    time_to_block: float | None = None
+    total_time: float | None = None
+    segments_checked: int = 0
+    chars_streamed: int = 0
+    blocked: bool = False
+
+
+async def run_streamed_with_guard(
+    agent: Agent[Any],
+    input: Any,
+    guardrail: OutputGuardrail[Any],
+    check: Callable[[str], Awaitable[GuardrailFunctionOutput]],
+    context: Any = None,
+    on_text: Callable[[str], None] | None = None,
+    min_segment_chars: int = 40,
+    max_segment_chars: int = 800,
+    metrics: StreamGuardMetrics | None = None,
+) -> tuple[str, StreamGuardMetrics]:
+    """Stream `agent` and run `check` on every finished sentence while tokens are still arriving.
+
+    As soon as a segment trips the guardrail the upstream generation is cancelled and
+    OutputGuardrailTripwireTriggered is raised, so a blocked answer stops costing tokens.
+    Only segments that passed are handed to `on_text`. Pass your own `metrics` to read
+    time_to_block after the exception.
+
+    Each check is a classifier call, so segments start at `min_segment_chars` (an early first
+    check) and double after every segment that passes, up to `max_segment_chars`: a long answer
+    costs a few calls instead of one per sentence. Since every segment already went through
+    `guardrail`, it is not run again on the complete text at the end; the agent's other output
+    guardrails still are.
+    """
+    metrics = metrics if metrics is not None else StreamGuardMetrics()
+    started = time.perf_counter()
+    text = ""
+    pending = ""
+    segment_chars = min_segment_chars
+
+    if guardrail in agent.output_guardrails:
+        agent = agent.clone(output_guardrails=[g for g in agent.output_guardrails if g is not guardrail])
+    result = Runner.run_streamed(agent, input, context=context)
+
+    async def check_segment(segment: str) -> None:
+        metrics.segments_checked += 1
+        output = await check(segment)
+        if output.tripwire_triggered:
+            metrics.blocked = True
+            metrics.time_to_block = time.perf_counter() - started
+            result.cancel()
+            raise OutputGuardrailTripwireTriggered(
+                OutputGuardrailResult(guardrail=guardrail, agent_output=text, agent=agent, output=output)
+            )
+        if on_text is not None:
+            on_text(segment)
+
+    try:
+        async for event in result.stream_events():
+            if event.type != "raw_response_event" or not isinstance(event.data, ResponseTextDeltaEvent):
+                continue
+
+            if metrics.time_to_first_token is None:
+                metrics.time_to_first_token = time.perf_counter() - started
+            text += event.data.delta
+            pending += event.data.delta
+            metrics.chars_streamed = len(text)
+
+            if len(pending) >= segment_chars and SEGMENT_END.search(pending):
+                segment, pending = pending, ""
+                await check_segment(segment)
+                segment_chars = min(segment_chars * 2, max_segment_chars)
+
+        if pending.strip():
+            await check_segment(pending)
+    finally:
+        metrics.total_time = time.perf_counter() - started
+
+    return text, metrics
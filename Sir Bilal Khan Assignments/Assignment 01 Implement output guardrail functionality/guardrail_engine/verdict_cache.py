@@ -0,0 +1,150 @@
+# guardrail_engine/verdict_cache.py
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Awaitable, Callable
+
+from pydantic import BaseModel
+
+
+def normalize_text(input_data: Any) -> str:
+    """Normalize guardrail input so trivially different texts share one cache entry"""
+    if not isinstance(input_data, str):
+        input_data = json.dumps(input_data, sort_keys=True, default=str)
+    text = unicodedata.normalize("NFKC", input_data).casefold()
+    return " ".join(text.split())
+
+
+def agent_fingerprint(agent: Any) -> str:
+    """Instructions + output schema of a guardrail agent, so a prompt change invalidates old verdicts"""
+    instructions = agent.instructions
+    if callable(instructions):
+        instructions = f"{instructions.__module__}.{instructions.__qualname__}"
+    return _fingerprint(instructions, agent.output_type)
+
+
+@lru_cache(maxsize=256)
+def _fingerprint(instructions: str, output_type: Any) -> str:
+    # Building the JSON schema is far slower than a cache hit, so do it once per agent
+    if isinstance(output_type, type) and issubclass(output_type, BaseModel):
+        schema = json.dumps(output_type.model_json_schema(), sort_keys=True)
+    else:
+        schema = repr(output_type)
+
+    return f"{instructions}\x00{schema}"
+
+
+class VerdictCache:
+    """LRU + TTL cache for guardrail verdicts with an optional SQLite backend on disk"""
+
+    def __init__(self, max_entries: int = 4096, ttl_seconds: float = 3600, disk_path: str | None = None):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[str, tuple[float, dict]] = OrderedDict()
+
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+        self._db = None
+        self._db_lock = threading.Lock()
+        if disk_path:
+            self._db = sqlite3.connect(disk_path, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS verdicts (key TEXT PRIMARY KEY, payload TEXT NOT NULL, expires_at REAL NOT NULL)"
+            )
+            self._db.commit()
+
+    def make_key(self, agent: Any, input_data: Any) -> str:
+        raw = f"{agent_fingerprint(agent)}\x00{normalize_text(input_data)}"
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def get(self, key: str, output_type: type[BaseModel]) -> BaseModel | None:
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires_at, payload = entry
+            if expires_at > time.time():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return output_type.model_validate(payload)
+            del self._entries[key]
+            self.expirations += 1
+
+        payload = self._disk_get(key)
+        if payload is not None:
+            self.disk_hits += 1
+            self._remember(key, payload[0], payload[1])
+            return output_type.model_validate(payload[1])
+
+        self.misses += 1
+        return None
+
+    def set(self, key: str, verdict: BaseModel) -> None:
+        expires_at = time.time() + self.ttl_seconds
+        payload = verdict.model_dump()
+        self._remember(key, expires_at, payload)
+        if self._db is not None:
+            with self._db_lock:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO verdicts (key, payload, expires_at) VALUES (?, ?, ?)",
+                    (key, json.dumps(payload), expires_at),
+                )
+                self._db.commit()
+
+    async def get_or_compute(
+        self, agent: Any, input_data: Any, compute: Callable[[], Awaitable[BaseModel]]
+    ) -> BaseModel:
+        """Return the cached verdict for this agent/input, or run `compute` and cache its result"""
+        key = self.make_key(agent, input_data)
+        verdict = self.get(key, agent.output_type)
+        if verdict is None:
+            verdict = await compute()
+            self.set(key, verdict)
+        return verdict
+
+    def clear(self) -> None:
+        self._entries.clear()
+        if self._db is not None:
+            with self._db_lock:
+                self._db.execute("DELETE FROM verdicts")
+                self._db.commit()
+
+    def stats(self) -> dict[str, Any]:
+        lookups = self.hits + self.disk_hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "hit_ratio": (self.hits + self.disk_hits) / lookups if lookups else 0.0,
+        }
+
+    def _remember(self, key: str, expires_at: float, payload: dict) -> None:
+        self._entries[key] = (expires_at, payload)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def _disk_get(self, key: str) -> tuple[float, dict] | None:
+        if self._db is None:
+            return None
+        with self._db_lock:
+            row = self._db.execute("SELECT payload, expires_at FROM verdicts WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            if row[1] <= time.time():
+                self._db.execute("DELETE FROM verdicts WHERE key = ?", (key,))
+                self._db.commit()
+                self.expirations += 1
+                return None
+        return row[1], json.loads(row[0])
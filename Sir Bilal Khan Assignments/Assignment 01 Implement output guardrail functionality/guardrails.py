@@ -17,61 +17,128 @@ from agents import (
 )
 from dotenv import find_dotenv, load_dotenv
 import os
+import sys
 import asyncio
 from gemini_config.connections import MODEL
+from guardrail_engine.verdict_cache import VerdictCache
+from guardrail_engine.politics_prefilter import PoliticsPrefilter
+from guardrail_engine.streaming_guard import StreamGuardMetrics, run_streamed_with_guard
+from guardrail_engine.batcher import GuardrailBatcher
+from guardrail_engine.speculative import SpeculativeRunner
 
 from pydantic import BaseModel
 
 load_dotenv(find_dotenv(), override=True)
 
+# Repeated inputs/outputs get their verdict from here instead of another Gemini round trip
+verdict_cache = VerdictCache(
+    max_entries=int(os.getenv("GUARDRAIL_CACHE_SIZE", "4096")),
+    ttl_seconds=float(os.getenv("GUARDRAIL_CACHE_TTL", "3600")),
+    disk_path=os.getenv("GUARDRAIL_CACHE_PATH") or None,
+)
+
+# Tiered mode (opt-in): the local lexicon decides clear cases, only the uncertain band reaches the LLM
+TIERED_OUTPUT_GUARDRAIL = os.getenv("GUARDRAIL_TIERED", "0") == "1"
+politics_prefilter = PoliticsPrefilter(
+    safe_threshold=float(os.getenv("GUARDRAIL_SAFE_THRESHOLD", "0.0")),
+    unsafe_threshold=float(os.getenv("GUARDRAIL_UNSAFE_THRESHOLD", "0.85")),
+)
+
+# Micro-batching: concurrent classifications are grouped into one structured-output call
+GUARDRAIL_BATCHING = os.getenv("GUARDRAIL_BATCHING", "0") == "1"
+GUARDRAIL_BATCH_SIZE = int(os.getenv("GUARDRAIL_BATCH_SIZE", "16"))
+GUARDRAIL_BATCH_WAIT_MS = float(os.getenv("GUARDRAIL_BATCH_WAIT_MS", "5"))
 
 
 class MathOutPut(BaseModel):
     is_math: bool
     reason: str
 
+input_agent = Agent(
+    "InputGuardrailAgent",
+    instructions="Check and verify if input is related to math",
+    model=MODEL,
+    output_type=MathOutPut,
+)
+input_batcher = GuardrailBatcher(input_agent, GUARDRAIL_BATCH_SIZE, GUARDRAIL_BATCH_WAIT_MS)
+
+async def classify_math(input_data: Any, context: Any = None) -> MathOutPut:
+    async def classify() -> MathOutPut:
+        if GUARDRAIL_BATCHING and isinstance(input_data, str):
+            return await input_batcher.classify(input_data)
+        result = await Runner.run(input_agent, input_data, context=context)
+        return result.final_output
+
+    return await verdict_cache.get_or_compute(input_agent, input_data, classify)
+
 @input_guardrail
 async def check_input(
     ctx: RunContextWrapper[Any], agent: Agent[Any], input_data: str | list[TResponseInputItem]
 ) -> GuardrailFunctionOutput:
     # print("input_data : ", input_data)
 
-    input_agent = Agent(
-        "InputGuardrailAgent",
-        instructions="Check and verify if input is related to math",
-        model=MODEL,
-        output_type=MathOutPut,
-    )
-    result = await Runner.run(input_agent, input_data, context=ctx.context)
-    final_output = result.final_output
+    final_output = await classify_math(input_data, ctx.context)
     # print(final_output)
 
     return GuardrailFunctionOutput(
         output_info=final_output, tripwire_triggered=not final_output.is_math
     )
 
+async def check_math_input(input_data: Any, context: Any = None) -> GuardrailFunctionOutput:
+    # Same decision as check_input, callable outside of a Runner for speculative runs
+    final_output = await classify_math(input_data, context)
+    return GuardrailFunctionOutput(
+        output_info=final_output, tripwire_triggered=not final_output.is_math
+    )
+
 class NoPoliticsOutput(BaseModel):
     is_safe: bool
     reason: str
 
+output_agent = Agent(
+    "InputGuardrailAgent",
+    instructions="Check if this text contains any political topic or political figure reference. "
+                 "Return is_safe=False if politics is mentioned.",
+    model=MODEL,
+    output_type=NoPoliticsOutput,
+)
+output_batcher = GuardrailBatcher(output_agent, GUARDRAIL_BATCH_SIZE, GUARDRAIL_BATCH_WAIT_MS)
+
+async def classify_politics(output_data: Any, context: Any = None) -> NoPoliticsOutput:
+    if TIERED_OUTPUT_GUARDRAIL:
+        text = output_data if isinstance(output_data, str) else str(output_data)
+        local = politics_prefilter.classify(text)
+        if local.label != "uncertain":
+            return NoPoliticsOutput(
+                is_safe=local.label == "safe",
+                reason=f"Local prefilter (score={local.score:.2f}, hits={local.hits})",
+            )
+
+    async def classify() -> NoPoliticsOutput:
+        if GUARDRAIL_BATCHING and isinstance(output_data, str):
+            return await output_batcher.classify(output_data)
+        result = await Runner.run(output_agent, output_data, context=context)
+        return result.final_output
+
+    return await verdict_cache.get_or_compute(output_agent, output_data, classify)
+
 @output_guardrail
 async def check_output(
     ctx: RunContextWrapper[Any], agent: Agent[Any], output_data: str | list[TResponseInputItem]
 ) -> GuardrailFunctionOutput:
-     output_agent = Agent(
-        "InputGuardrailAgent",
-        instructions="Check if this text contains any political topic or political figure reference. "
-                     "Return is_safe=False if politics is mentioned.",
-        model=MODEL,
-        output_type=NoPoliticsOutput,
-    )
-     result = await Runner.run(output_agent, output_data, context=ctx.context)
-     final_output = result.final_output
+     final_output = await classify_politics(output_data, ctx.context)
 
      return GuardrailFunctionOutput(
         output_info=final_output, tripwire_triggered=not final_output.is_safe
     )
 
+async def check_output_segment(segment: str) -> GuardrailFunctionOutput:
+    # Same decision as check_output, applied to one streamed sentence at a time
+    final_output = await classify_politics(segment)
+    return GuardrailFunctionOutput(
+        output_info=final_output, tripwire_triggered=not final_output.is_safe
+    )
+
 math_agent = Agent(
     "MathAgent",
     instructions="You are a math agent",
@@ -79,6 +146,9 @@ math_agent = Agent(
     input_guardrails=[check_input],
 )
 
+# Opt-in: run math_agent while check_input is still deciding, cancel it if the tripwire fires
+speculative_math_agent = SpeculativeRunner(math_agent, check_input, check_math_input)
+
 general_agent = Agent(
     "GeneralAgent",
     instructions="You are a helpful agent",
@@ -88,11 +158,29 @@ general_agent = Agent(
 
 
 async def main():
+    metrics = StreamGuardMetrics()
     try:
         # a = 10/0
         msg = input("Enter your question: ")
-        result = await Runner.run(general_agent, msg)
-        print(f"\n\nFinal Output : {result.final_output}")
+        if "--stream" in sys.argv:
+            # Check the answer sentence by sentence and stop generating as soon as it trips
+            print("\n\nFinal Output : ", end="", flush=True)
+            await run_streamed_with_guard(
+                general_agent,
+                msg,
+                guardrail=check_output,
+                check=check_output_segment,
+                on_text=lambda segment: print(segment, end="", flush=True),
+                metrics=metrics,
+            )
+            print(f"\n\nTime to first token: {metrics.time_to_first_token}s, total: {metrics.total_time}s")
+        elif "--speculative" in sys.argv:
+            result = await speculative_math_agent.run(msg)
+            print(f"\n\nFinal Output : {result.final_output}")
+            print(f"Speculation: {speculative_math_agent.stats}")
+        else:
+            result = await Runner.run(general_agent, msg)
+            print(f"\n\nFinal Output : {result.final_output}")
 
     except InputGuardrailTripwireTriggered as ex:
         print("❌ Error: Invalid prompt (Input Guardrail triggered)")
@@ -100,6 +188,8 @@ async def main():
 
     except OutputGuardrailTripwireTriggered as ex:
         print("❌ Error: Output blocked (Output Guardrail triggered)")
+        if metrics.blocked:
+            print(f"Blocked after {metrics.time_to_block}s (first token at {metrics.time_to_first_token}s)")
         # ex.result ke andar reason hota hai
         try:
             print("Reason:", ex.result.output_info.reason)
@@ -1,10 +1,13 @@
 from agents import Runner
-from my_agent.handoff_agent import triagent
+from my_agent.handoff_agent import local_router, route
 from decouple import config
 
+question = "Who is muslims"
+
 res = Runner.run_sync(
-    starting_agent=triagent,
-    input="Who is muslims",
+    starting_agent=route(question),
+    input=question,
 )
 
 print(res.final_output)
+print("Routing:", local_router.stats())
@@ -0,0 +1,41 @@
+# Labeled questions the local router is trained on. Add examples here when a
+# clear question keeps falling back to the LLM triage.
+ROUTING_EXAMPLES = [
+    ("Who are Muslims?", "islam"),
+    ("What is Islam?", "islam"),
+    ("What are the five pillars of Islam?", "islam"),
+    ("How many times a day do Muslims pray?", "islam"),
+    ("What are the five daily prayers in Islam?", "islam"),
+    ("What is salah and how is it performed?", "islam"),
+    ("Why do Muslims fast in Ramadan?", "islam"),
+    ("What is zakat and who has to pay it?", "islam"),
+    ("What is Hajj and when is it performed in Makkah?", "islam"),
+    ("Who was Prophet Muhammad?", "islam"),
+    ("What does the Quran say about patience?", "islam"),
+    ("What is a hadith and what is the Sunnah?", "islam"),
+    ("What is the meaning of Eid ul Fitr and Eid ul Adha?", "islam"),
+    ("What is halal food?", "islam"),
+    ("What is the role of the mosque and the imam?", "islam"),
+    ("What is wudu before namaz?", "islam"),
+    ("What is the shahada?", "islam"),
+    ("Who is Allah in Islam?", "islam"),
+    ("What happens on Laylat al-Qadr?", "islam"),
+    ("Who are Christians?", "christianity"),
+    ("What is Christianity?", "christianity"),
+    ("Who is Jesus Christ?", "christianity"),
+    ("What is the Holy Trinity?", "christianity"),
+    ("What does the Bible say about forgiveness?", "christianity"),
+    ("What is the difference between the Old Testament and the New Testament?", "christianity"),
+    ("Why do Christians celebrate Easter?", "christianity"),
+    ("What is the meaning of Christmas?", "christianity"),
+    ("What is baptism in the church?", "christianity"),
+    ("Who were the twelve apostles and disciples?", "christianity"),
+    ("What is the crucifixion and resurrection?", "christianity"),
+    ("What are the four gospels?", "christianity"),
+    ("What is Lent and Good Friday?", "christianity"),
+    ("Who is the Pope and what does the Vatican do?", "christianity"),
+    ("What is the difference between Catholic and Protestant churches?", "christianity"),
+    ("What is Holy Communion and the Eucharist?", "christianity"),
+    ("Who was Saint Paul?", "christianity"),
+    ("What is the Lord's Prayer?", "christianity"),
+]
@@ -0,0 +1,155 @@
+# batch_runner.py
+import asyncio
+import json
+import math
+import sys
+import time
+from dataclasses import dataclass, field, replace
+from typing import IO, Iterable, Iterator
+
+from agents import Agent, InputGuardrailTripwireTriggered, Runner
+
+from context.hotel_context import HotelContext
+
+
+def read_queries(lines: Iterable[str]) -> Iterator[tuple[int, dict, str | None]]:
+    """Parse JSONL lines into (position, record, error). A line is {"query": "...", ...} or just a JSON string.
+
+    A line that isn't valid JSON, or has no string "query", gets an error instead of stopping the batch.
+    """
+    position = 0
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as ex:
+            yield position, {}, f"Invalid JSON: {ex}"
+            position += 1
+            continue
+        if isinstance(record, str):
+            record = {"query": record}
+        if not isinstance(record, dict):
+            yield position, {}, "Expected a JSON object or string"
+        elif not isinstance(record.get("query"), str):
+            yield position, record, 'Missing "query" string'
+        else:
+            yield position, record, None
+        position += 1
+
+
+def percentile(sorted_values: list[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    rank = max(0, math.ceil(pct / 100 * len(sorted_values)) - 1)
+    return sorted_values[rank]
+
+
+@dataclass
+class BatchStats:
+    total: int = 0
+    ok: int = 0
+    blocked: int = 0
+    failed: int = 0
+    elapsed: float = 0.0
+    latencies: list[float] = field(default_factory=list)
+
+    def summary(self) -> dict:
+        latencies = sorted(self.latencies)
+        return {
+            "total": self.total,
+            "ok": self.ok,
+            "blocked": self.blocked,
+            "failed": self.failed,
+            "elapsed_s": round(self.elapsed, 3),
+            "queries_per_s": round(self.total / self.elapsed, 2) if self.elapsed else 0.0,
+            "p50_s": round(percentile(latencies, 50), 3),
+            "p95_s": round(percentile(latencies, 95), 3),
+            "p99_s": round(percentile(latencies, 99), 3),
+        }
+
+
+# Fields the runner sets on every result; input records can't override them
+RESULT_FIELDS = {"position", "query", "status", "answer", "error", "latency_s"}
+
+
+async def answer(agent: Agent, context: HotelContext, position: int, record: dict, error: str | None = None) -> dict:
+    query = record.get("query")
+    started = time.perf_counter()
+    result = {key: value for key, value in record.items() if key not in RESULT_FIELDS}
+    result.update(position=position, query=query)
+    if error is not None:
+        # Never ran, so there is no latency to report
+        result.update(status="error", answer=None, error=error, latency_s=None)
+        return result
+    try:
+        res = await Runner.run(agent, input=query, context=replace(context, query=query))
+        result.update(status="ok", answer=res.final_output)
+    except InputGuardrailTripwireTriggered:
+        result.update(status="blocked", answer=None)
+    except Exception as ex:
+        result.update(status="error", answer=None, error=f"{type(ex).__name__}: {ex}")
+    result["latency_s"] = round(time.perf_counter() - started, 3)
+    return result
+
+
+async def run_batch(
+    agent: Agent,
+    context: HotelContext,
+    lines: Iterable[str],
+    out: IO[str] = sys.stdout,
+    concurrency: int = 8,
+    ordered: bool = False,
+) -> BatchStats:
+    """Answer every query in `lines` with at most `concurrency` runs in flight, writing results to `out` as JSONL.
+
+    Results are written as soon as they finish, or, with `ordered`, as soon as every earlier query has finished.
+    A query holds its slot until its result is written, so at most `concurrency` queries are running or
+    waiting to be written and inputs of any size stream through in bounded memory. With `ordered`, one
+    slow query therefore holds back new work until it finishes.
+    """
+    stats = BatchStats()
+    semaphore = asyncio.Semaphore(concurrency)
+    pending: dict[int, dict] = {}
+    next_position = 0
+    tasks: set[asyncio.Task] = set()
+
+    def write(result: dict) -> None:
+        out.write(json.dumps(result, ensure_ascii=False) + "\n")
+        out.flush()
+        semaphore.release()
+
+    def finished(result: dict) -> None:
+        nonlocal next_position
+        stats.total += 1
+        if result["latency_s"] is not None:
+            stats.latencies.append(result["latency_s"])
+        if result["status"] == "ok":
+            stats.ok += 1
+        elif result["status"] == "blocked":
+            stats.blocked += 1
+        else:
+            stats.failed += 1
+
+        if not ordered:
+            write(result)
+            return
+        pending[result["position"]] = result
+        while next_position in pending:
+            write(pending.pop(next_position))
+            next_position += 1
+
+    async def worker(position: int, record: dict, error: str | None) -> None:
+        finished(await answer(agent, context, position, record, error))
+
+    started = time.perf_counter()
+    for position, record, error in read_queries(lines):
+        await semaphore.acquire()
+        task = asyncio.create_task(worker(position, record, error))
+        tasks.add(task)
+        task.add_done_callback(tasks.discard)
+    if tasks:
+        await asyncio.gather(*tasks)
+    stats.elapsed = time.perf_counter() - started
+    return stats
@@ -0,0 +1,67 @@
+# bench_hotel_store.py
+# Load time, lookup latency and memory per record of HotelStore at 100k+ hotels.
+# Run from the assignment folder:  python -m benchmarks.bench_hotel_store [hotels]
+import random
+import sys
+import time
+import tracemalloc
+
+from context.hotel_store import HotelStore
+
+CITIES = ["karachi", "lahore", "islamabad", "quetta", "peshawar", "multan", "faisalabad", "hyderabad"]
+
+
+def make_hotels(count: int) -> dict[str, dict]:
+    rng = random.Random(42)
+    hotels = {}
+    for i in range(count):
+        total = rng.randint(20, 400)
+        special = rng.randint(0, total // 10)
+        hotels[f"hotel_{i}"] = {
+            "name": f"Hotel {i} Grand",
+            "owner": f"Owner {i % 5000}",
+            "location": rng.choice(CITIES),
+            "total_rooms": total,
+            "special_rooms": special,
+            "available_rooms": rng.randint(0, total - special),
+        }
+    return hotels
+
+
+def timed(label: str, fn, repeat: int) -> None:
+    started = time.perf_counter()
+    for i in range(repeat):
+        fn(i)
+    elapsed = time.perf_counter() - started
+    print(f"{label:<40} {elapsed / repeat * 1e6:10.1f} us/op")
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    hotels = make_hotels(count)
+
+    started = time.perf_counter()
+    store = HotelStore.from_dict(hotels)
+    load_time = time.perf_counter() - started
+
+    # Second load only to measure memory, tracemalloc slows the load down a lot
+    del store
+    tracemalloc.start()
+    store = HotelStore.from_dict(hotels)
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f"hotels: {count}")
+    print(f"load time: {load_time:.2f}s")
+    print(f"memory: {memory / 1e6:.1f} MB ({memory / count:.0f} bytes/record)")
+
+    timed("row_by_name", lambda i: store.row_by_name(f"Hotel {i % count} Grand"), 10_000)
+    timed("rows_in_city", lambda i: store.rows_in_city(CITIES[i % len(CITIES)]), 100)
+    timed("rows_by_owner", lambda i: store.rows_by_owner(f"Owner {i % 5000}"), 10_000)
+    timed("rows_with_available(350)", lambda i: store.rows_with_available(350), 100)
+    timed("search('hotel N grand')", lambda i: store.search(f"hotel {i} grand"), 100)
+    timed("set_available", lambda i: store.set_available(i % count, i % 300), 10_000)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+# bench_reservations.py
+# Thousands of simultaneous booking attempts against ReservationEngine; checks nothing is oversold.
+# Run from the assignment folder:  python -m benchmarks.bench_reservations [attempts] [hotels]
+import asyncio
+import random
+import sys
+import time
+
+from benchmarks.bench_hotel_store import make_hotels
+from context.hotel_store import HotelStore
+from context.reservations import ReservationEngine, ReservationError
+
+
+async def slow_commit(booking, delta) -> None:
+    # Stand-in for a database write: yields to other sessions while holding the hotel lock
+    await asyncio.sleep(0)
+
+
+async def attempt(engine: ReservationEngine, name: str, rooms: int, release: bool) -> bool:
+    try:
+        booking = await engine.reserve(name, rooms)
+    except ReservationError:
+        return False
+    if release:
+        await engine.release(booking.booking_id)
+    return True
+
+
+async def run(attempts: int, hotels: int) -> None:
+    store = HotelStore.from_dict(make_hotels(hotels))
+    engine = ReservationEngine(store, commit=slow_commit)
+    before = list(store.available_rooms)
+
+    rng = random.Random(7)
+    # Few hotels, many sessions: most attempts fight over the same locks
+    jobs = [
+        attempt(engine, store.names[rng.randrange(hotels)], rng.randint(1, 5), rng.random() < 0.2)
+        for _ in range(attempts)
+    ]
+    started = time.perf_counter()
+    results = await asyncio.gather(*jobs)
+    elapsed = time.perf_counter() - started
+
+    booked = [0] * hotels
+    for booking in engine._bookings.values():
+        booked[booking.row] += booking.rooms
+    for row in range(hotels):
+        assert store.available_rooms[row] >= 0, f"{store.names[row]} oversold"
+        assert store.available_rooms[row] + booked[row] == before[row], f"{store.names[row]} lost rooms"
+
+    print(f"attempts: {attempts} on {hotels} hotels")
+    print(f"succeeded: {sum(results)}  rejected: {engine.rejected}")
+    print(f"stats: {engine.stats()}")
+    print(f"time: {elapsed:.2f}s  ({attempts / elapsed:,.0f} attempts/s)")
+    print("no hotel oversold, every room accounted for")
+
+
+def main() -> None:
+    attempts = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    hotels = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    asyncio.run(run(attempts, hotels))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+# entity_matcher.py
+import re
+from collections import deque
+
+from context.hotel_store import HotelStore
+
+WORD_RE = re.compile(r"[a-z0-9]+")
+
+# Entities shorter than this (after normalizing) are too easy to hit by accident
+MIN_ENTITY_CHARS = 3
+
+
+def words(text: str) -> str:
+    """Lowercase words joined by single spaces and padded with one, so matches can only land on word boundaries"""
+    return " " + " ".join(WORD_RE.findall(text.lower())) + " "
+
+
+class EntityMatcher:
+    """Aho-Corasick automaton over every hotel name, owner and location in a HotelStore.
+
+    One pass over the query finds all known entities it mentions, however many hotels there are.
+    The automaton is rebuilt lazily the first time it is used after `store.version` changes.
+    """
+
+    def __init__(self, store: HotelStore):
+        self.store = store
+        self.built_version = -1
+        self._goto: list[dict[str, int]] = []
+        self._fail: list[int] = []
+        self._out: list[list[str]] = []
+
+        self.rebuilds = 0
+        self.matched = 0
+        self.missed = 0
+
+    def find(self, text: str) -> list[str]:
+        """All known entities mentioned in `text`, in the order they end"""
+        if self.built_version != self.store.version:
+            self._build()
+
+        goto, fail, out = self._goto, self._fail, self._out
+        state = 0
+        found = []
+        for char in words(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if out[state]:
+                found.extend(out[state])
+
+        if found:
+            self.matched += 1
+        else:
+            self.missed += 1
+        return found
+
+    def stats(self) -> dict[str, int]:
+        return {"rebuilds": self.rebuilds, "matched": self.matched, "missed": self.missed}
+
+    def _build(self) -> None:
+        store = self.store
+        entities = set()
+        for row in store.rows():
+            for value in (store.names[row], store.owners[row], store.locations[row]):
+                if len(value.strip()) >= MIN_ENTITY_CHARS:
+                    entities.add(value)
+
+        goto: list[dict[str, int]] = [{}]
+        out: list[list[str]] = [[]]
+        for entity in entities:
+            state = 0
+            for char in words(entity):
+                next_state = goto[state].get(char)
+                if next_state is None:
+                    next_state = goto[state][char] = len(goto)
+                    goto.append({})
+                    out.append([])
+                state = next_state
+            out[state].append(entity)
+
+        # Breadth-first so a state's failure link is always finished before its children need it
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, child in goto[state].items():
+                queue.append(child)
+                link = fail[state]
+                while link and char not in goto[link]:
+                    link = fail[link]
+                fail[child] = goto[link].get(char, 0)
+                out[child] = out[child] + out[fail[child]]
+
+        self._goto, self._fail, self._out = goto, fail, out
+        self.built_version = store.version
+        self.rebuilds += 1
@@ -1,28 +1,48 @@
-hotel_context = {
-    "hotels": {
-        "hotel_sannata": {
-            "name": "Hotel Sannata",
-            "owner": "Mr. Ratan Lal",
-            "location": "karachi",
-            "total_rooms": 200,
-            "special_rooms": 20,
-            "available_rooms": 180
-        },
-        "hotel_paradise": {
-            "name": "Hotel Paradise",
-            "owner": "Ms. Sunita Sharma",
-            "location": "islamabad",
-            "total_rooms": 150,
-            "special_rooms": 10,
-            "available_rooms": 140
-        },
-        "hotel_queen": {
-            "name": "Hotel Queen",
-            "owner": "Ms. Sunita Sharma",
-            "location": "lahore",
-            "total_rooms": 150,
-            "special_rooms": 10,
-            "available_rooms": 140
-        }
+from dataclasses import dataclass
+
+from context.entity_matcher import EntityMatcher
+from context.hotel_store import HotelStore
+from context.reservations import ReservationEngine
+
+HOTELS = {
+    "hotel_sannata": {
+        "name": "Hotel Sannata",
+        "owner": "Mr. Ratan Lal",
+        "location": "karachi",
+        "total_rooms": 200,
+        "special_rooms": 20,
+        "available_rooms": 180
+    },
+    "hotel_paradise": {
+        "name": "Hotel Paradise",
+        "owner": "Ms. Sunita Sharma",
+        "location": "islamabad",
+        "total_rooms": 150,
+        "special_rooms": 10,
+        "available_rooms": 140
+    },
+    "hotel_queen": {
+        "name": "Hotel Queen",
+        "owner": "Ms. Sunita Sharma",
+        "location": "lahore",
+        "total_rooms": 150,
+        "special_rooms": 10,
+        "available_rooms": 140
     }
-}
\ No newline at end of file
+}
+
+hotel_store = HotelStore.from_dict(HOTELS)
+reservations = ReservationEngine(hotel_store)
+hotel_matcher = EntityMatcher(hotel_store)
+
+
+@dataclass
+class HotelContext:
+    """Run context shared by the hotel assistant, its tools and its guardrail"""
+    store: HotelStore
+    reservations: ReservationEngine
+    matcher: EntityMatcher
+    query: str = ""
+
+
+hotel_context = HotelContext(store=hotel_store, reservations=reservations, matcher=hotel_matcher)
@@ -0,0 +1,79 @@
+# hotel_index.py
+import heapq
+import math
+import re
+from array import array
+from collections import defaultdict
+
+TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+# How much a query word counts depending on which field of the hotel it matched
+FIELD_WEIGHTS = {"name": 3.0, "location": 2.0, "owner": 2.0}
+
+# A word matching more than this share of hotels is treated as too generic to search by
+COMMON_SHARE = 0.25
+COMMON_MIN_ROWS = 1000
+
+
+def tokenize(text: str) -> list[str]:
+    return TOKEN_RE.findall(text.lower())
+
+
+class HotelIndex:
+    """Inverted index over hotel name, location and owner used to pick the hotels a query is about.
+
+    Postings are compact arrays of store row ids, one table per field.
+    """
+
+    __slots__ = ("_fields", "size")
+
+    def __init__(self):
+        self._fields: dict[str, dict[str, array]] = {field: {} for field in FIELD_WEIGHTS}
+        self.size = 0
+
+    def add(self, row: int, fields: dict[str, str]) -> None:
+        self.size += 1
+        for field, text in fields.items():
+            postings = self._fields[field]
+            for token in set(tokenize(text)):
+                rows = postings.get(token)
+                if rows is None:
+                    rows = postings[token] = array("I")
+                rows.append(row)
+
+    def remove(self, row: int, fields: dict[str, str]) -> None:
+        self.size -= 1
+        for field, text in fields.items():
+            postings = self._fields[field]
+            for token in set(tokenize(text)):
+                rows = postings.get(token)
+                if rows is not None and row in rows:
+                    rows.remove(row)
+                    if not rows:
+                        del postings[token]
+
+    def search(self, query: str, limit: int = 10, min_relative_score: float = 0.5) -> list[int]:
+        matches = []
+        for token in set(tokenize(query)):
+            for field, weight in FIELD_WEIGHTS.items():
+                rows = self._fields[field].get(token)
+                if rows:
+                    matches.append((len(rows), weight, rows))
+        # Words shared by a large share of hotels (e.g. "hotel") add almost nothing to the
+        # score but would make us score every row, so they are left out
+        matches.sort(key=lambda match: match[0])
+        common = max(COMMON_MIN_ROWS, self.size * COMMON_SHARE)
+        if not matches or matches[0][0] > common:
+            # Only generic words, the query doesn't single out any hotel
+            return []
+
+        scores: dict[int, float] = defaultdict(float)
+        for count, weight, rows in matches:
+            if count > common:
+                continue
+            score = weight * math.log(1 + self.size / count)
+            for row in rows:
+                scores[row] += score
+        # Drop hotels that only share a weak word with the query while a better match exists
+        cutoff = max(scores.values()) * min_relative_score
+        return heapq.nlargest(limit, (row for row, score in scores.items() if score >= cutoff), key=scores.get)
@@ -0,0 +1,187 @@
+# hotel_store.py
+import sys
+from array import array
+from itertools import islice
+from bisect import bisect_left, insort
+
+from context.hotel_index import HotelIndex
+
+# Availability index entries pack (available_rooms, row) into one sortable 64-bit number
+ROW_BITS = 32
+ROW_MASK = (1 << ROW_BITS) - 1
+
+
+def normalize(value: str) -> str:
+    return " ".join(value.lower().split())
+
+
+class HotelStore:
+    """Column store for hotels with secondary indexes on name, location, owner and availability.
+
+    Every hotel is a row number; its fields live in parallel lists/arrays instead of one dict
+    per hotel, and repeated strings (cities, owners) are interned so they are stored once.
+    `version` changes whenever hotels are added or removed, `revision` whenever any field changes.
+    """
+
+    __slots__ = (
+        "keys", "names", "owners", "locations", "total_rooms", "special_rooms", "available_rooms",
+        "_by_key", "_by_name", "_by_location", "_by_owner", "_by_available", "_index",
+        "version", "revision",
+    )
+
+    def __init__(self):
+        self.keys: list[str] = []
+        self.names: list[str] = []
+        self.owners: list[str] = []
+        self.locations: list[str] = []
+        self.total_rooms = array("I")
+        self.special_rooms = array("I")
+        self.available_rooms = array("I")
+
+        self._by_key: dict[str, int] = {}
+        self._by_name: dict[str, array] = {}
+        self._by_location: dict[str, array] = {}
+        self._by_owner: dict[str, array] = {}
+        self._by_available = array("Q")
+        self._index = HotelIndex()
+        self.version = 0
+        self.revision = 0
+
+    def __len__(self) -> int:
+        return len(self._by_key)
+
+    def add(
+        self,
+        key: str,
+        name: str,
+        owner: str,
+        location: str,
+        total_rooms: int,
+        special_rooms: int,
+        available_rooms: int,
+    ) -> int:
+        row = self._append(key, name, owner, location, total_rooms, special_rooms, available_rooms)
+        insort(self._by_available, (available_rooms << ROW_BITS) | row)
+        self.version += 1
+        self.revision += 1
+        return row
+
+    def remove(self, key: str) -> None:
+        row = self._by_key.pop(key)
+        name = normalize(self.names[row])
+        self._by_name[name].remove(row)
+        if not self._by_name[name]:
+            del self._by_name[name]
+        self._by_location[normalize(self.locations[row])].remove(row)
+        self._by_owner[normalize(self.owners[row])].remove(row)
+        self._drop_available(row)
+        self._index.remove(row, self._search_fields(row))
+        self.version += 1
+        self.revision += 1
+
+    def set_available(self, row: int, available_rooms: int) -> None:
+        """Update a row's available_rooms and keep the availability index in order"""
+        self._drop_available(row)
+        self.available_rooms[row] = available_rooms
+        insort(self._by_available, (available_rooms << ROW_BITS) | row)
+        self.revision += 1
+
+    def row_of(self, key: str) -> int | None:
+        return self._by_key.get(key)
+
+    def row_by_name(self, name: str) -> int | None:
+        """The first hotel with this name; hotels in different cities may share one"""
+        rows = self._by_name.get(normalize(name))
+        return rows[0] if rows else None
+
+    def rows_in_city(self, city: str) -> list[int]:
+        return list(self._by_location.get(normalize(city), ()))
+
+    def rows_by_owner(self, owner: str) -> list[int]:
+        return list(self._by_owner.get(normalize(owner), ()))
+
+    def rows_with_available(self, min_rooms: int, city: str | None = None) -> list[int]:
+        """Rows with at least `min_rooms` available, most available first"""
+        start = bisect_left(self._by_available, min_rooms << ROW_BITS)
+        rows = [packed & ROW_MASK for packed in reversed(self._by_available[start:])]
+        if city is not None:
+            in_city = set(self._by_location.get(normalize(city), ()))
+            rows = [row for row in rows if row in in_city]
+        return rows
+
+    def search(self, query: str, limit: int = 10) -> list[int]:
+        return self._index.search(query, limit=limit)
+
+    def rows(self, limit: int | None = None) -> list[int]:
+        return list(islice(self._by_key.values(), limit))
+
+    def record(self, row: int) -> dict:
+        return {
+            "name": self.names[row],
+            "owner": self.owners[row],
+            "location": self.locations[row],
+            "total_rooms": self.total_rooms[row],
+            "special_rooms": self.special_rooms[row],
+            "available_rooms": self.available_rooms[row],
+        }
+
+    def render(self, row: int) -> str:
+        return (
+            f"- {self.names[row]} | location: {self.locations[row]} | owner: {self.owners[row]} | "
+            f"total_rooms: {self.total_rooms[row]} | special_rooms: {self.special_rooms[row]} | "
+            f"available_rooms: {self.available_rooms[row]}"
+        )
+
+    @classmethod
+    def from_dict(cls, hotels: dict[str, dict]) -> "HotelStore":
+        store = cls()
+        for key, hotel in hotels.items():
+            store._append(key, **hotel)
+        store._by_available = array(
+            "Q", sorted((available << ROW_BITS) | row for row, available in enumerate(store.available_rooms))
+        )
+        store.version += 1
+        store.revision += 1
+        return store
+
+    def _append(
+        self,
+        key: str,
+        name: str,
+        owner: str,
+        location: str,
+        total_rooms: int,
+        special_rooms: int,
+        available_rooms: int,
+    ) -> int:
+        # Everything but the availability index, which bulk loads sort once at the end
+        if key in self._by_key:
+            raise ValueError(f"Hotel {key!r} already exists")
+
+        row = len(self.keys)
+        owner = sys.intern(owner)
+        location = sys.intern(location)
+
+        self.keys.append(key)
+        self.names.append(name)
+        self.owners.append(owner)
+        self.locations.append(location)
+        self.total_rooms.append(total_rooms)
+        self.special_rooms.append(special_rooms)
+        self.available_rooms.append(available_rooms)
+
+        self._by_key[key] = row
+        self._by_name.setdefault(normalize(name), array("I")).append(row)
+        self._by_location.setdefault(normalize(location), array("I")).append(row)
+        self._by_owner.setdefault(normalize(owner), array("I")).append(row)
+        self._index.add(row, self._search_fields(row))
+        return row
+
+    def _drop_available(self, row: int) -> None:
+        packed = (self.available_rooms[row] << ROW_BITS) | row
+        position = bisect_left(self._by_available, packed)
+        if position < len(self._by_available) and self._by_available[position] == packed:
+            del self._by_available[position]
+
+    def _search_fields(self, row: int) -> dict[str, str]:
+        return {"name": self.names[row], "location": self.locations[row], "owner": self.owners[row]}
@@ -0,0 +1,89 @@
+# reservations.py
+import asyncio
+import itertools
+from dataclasses import dataclass
+from typing import Awaitable, Callable
+
+from context.hotel_store import HotelStore
+
+
+class ReservationError(Exception):
+    pass
+
+
+@dataclass
+class Booking:
+    booking_id: str
+    row: int
+    rooms: int
+
+
+class ReservationEngine:
+    """Atomic reserve/release of rooms on top of a HotelStore's available_rooms counters.
+
+    Each hotel has its own asyncio.Lock, so the check-and-decrement of one hotel never
+    interleaves with another session booking the same hotel, even when `commit` awaits
+    (e.g. writing the booking to a database). Different hotels are booked in parallel.
+    """
+
+    def __init__(self, store: HotelStore, commit: Callable[[Booking, int], Awaitable[None]] | None = None):
+        self.store = store
+        self.commit = commit
+        self._locks: dict[int, asyncio.Lock] = {}
+        self._bookings: dict[str, Booking] = {}
+        self._ids = itertools.count(1)
+
+        self.reserved = 0
+        self.released = 0
+        self.rejected = 0
+
+    async def reserve(self, hotel_name: str, rooms: int) -> Booking:
+        if rooms <= 0:
+            raise ReservationError("Number of rooms must be positive")
+        row = self.store.row_by_name(hotel_name)
+        if row is None:
+            raise ReservationError(f"No hotel named {hotel_name!r}")
+
+        async with self._lock(row):
+            available = self.store.available_rooms[row]
+            if available < rooms:
+                self.rejected += 1
+                raise ReservationError(f"Only {available} rooms available at {self.store.names[row]}")
+
+            booking = Booking(f"BK{next(self._ids):08d}", row, rooms)
+            if self.commit is not None:
+                await self.commit(booking, -rooms)
+            self.store.set_available(row, available - rooms)
+            self._bookings[booking.booking_id] = booking
+            self.reserved += 1
+            return booking
+
+    async def release(self, booking_id: str) -> Booking:
+        booking = self._bookings.get(booking_id)
+        if booking is None:
+            raise ReservationError(f"No booking with id {booking_id!r}")
+
+        async with self._lock(booking.row):
+            # Checked again under the lock so two releases of one booking can't both succeed
+            if booking_id not in self._bookings:
+                raise ReservationError(f"No booking with id {booking_id!r}")
+            if self.commit is not None:
+                await self.commit(booking, booking.rooms)
+            del self._bookings[booking_id]
+            self.store.set_available(booking.row, self.store.available_rooms[booking.row] + booking.rooms)
+            self.released += 1
+            return booking
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "active_bookings": len(self._bookings),
+            "reserved": self.reserved,
+            "released": self.released,
+            "rejected": self.rejected,
+        }
+
+    def _lock(self, row: int) -> asyncio.Lock:
+        lock = self._locks.get(row)
+        if lock is None:
+            lock = self._locks[row] = asyncio.Lock()
+        return lock
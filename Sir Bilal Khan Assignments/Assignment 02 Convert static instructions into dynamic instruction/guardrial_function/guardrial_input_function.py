@@ -1,9 +1,34 @@
 # guardrial_input_function.py
 from agents import input_guardrail, RunContextWrapper, GuardrailFunctionOutput, Runner
 from my_agent.guardrial_agents import guardrial_agent
+from data_schema.myDataSchema import MyDataType
+
+
+def input_text(input) -> str:
+    if isinstance(input, str):
+        return input
+    # Conversation input: only the user's own messages can name a hotel
+    return " ".join(
+        item["content"] for item in input
+        if isinstance(item, dict) and item.get("role") == "user" and isinstance(item.get("content"), str)
+    )
+
 
 @input_guardrail
 async def guardrial_input_function(ctx: RunContextWrapper, agent, input):
+    # Queries that name one of our hotels, owners or cities are clearly about hotels, no LLM needed
+    matcher = getattr(ctx.context, "matcher", None)
+    if matcher is not None:
+        entities = matcher.find(input_text(input))
+        if entities:
+            return GuardrailFunctionOutput(
+                output_info=MyDataType(
+                    is_query_about_hotel_sannata=True,
+                    reason=f"Mentions {', '.join(dict.fromkeys(entities))}",
+                ),
+                tripwire_triggered=False,
+            )
+
     result = await Runner.run(guardrial_agent, input=input, context=ctx.context)
     
     # Modified to allow any hotel-related queries, not just Hotel Sannata
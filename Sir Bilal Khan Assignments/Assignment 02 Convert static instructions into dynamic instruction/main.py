@@ -1,9 +1,31 @@
 # main.py
+import argparse
+import asyncio
+import json
+import sys
+from dataclasses import replace
 from agents import Runner, set_tracing_disabled, InputGuardrailTripwireTriggered
 from my_agent.hotel_assistant import hotel_assistant
-from context import hotel_context
+from context.hotel_context import hotel_context
+from batch.batch_runner import run_batch
 set_tracing_disabled(True)
 
+parser = argparse.ArgumentParser(description="Hotel customer care assistant")
+parser.add_argument("--batch", metavar="FILE", help='answer every query in a JSONL file ("-" for stdin)')
+parser.add_argument("--concurrency", type=int, default=8, help="queries answered at the same time in batch mode")
+parser.add_argument("--ordered", action="store_true", help="write batch results in input order")
+args = parser.parse_args()
+
+if args.batch:
+    # Results go to stdout as JSONL, the summary goes to stderr so it can't mix into them
+    source = sys.stdin if args.batch == "-" else open(args.batch, encoding="utf-8")
+    with source:
+        stats = asyncio.run(
+            run_batch(hotel_assistant, hotel_context, source, concurrency=args.concurrency, ordered=args.ordered)
+        )
+    print(json.dumps(stats.summary()), file=sys.stderr)
+    sys.exit(0)
+
 # Sample context with multiple hotels
 
 prompt = input("Enter your query: ")
@@ -12,7 +34,8 @@ try:
     res = Runner.run_sync(
         starting_agent=hotel_assistant, 
         input= prompt,
-        context=hotel_context  # Pass the dynamic context
+        # The query goes into the context so the instructions only include matching hotels
+        context=replace(hotel_context, query=prompt)
     )
     print(res.final_output)
 except InputGuardrailTripwireTriggered as e:
@@ -1,11 +1,22 @@
 # hotel_assistant.py
-from agents import Agent
+from agents import Agent, RunContextWrapper
+from model_client import StableInstructions
 from my_config.gemini_confg import MODEL
 from guardrial_function.guardrial_input_function import guardrial_input_function
+from context.hotel_context import HotelContext
+from tools.hotel_tools import (
+    filter_hotels_by_available_rooms,
+    list_hotels_in_city,
+    lookup_hotel_by_name,
+    release_booking,
+    reserve_rooms,
+)
 
-hotel_assistant = Agent(
-    name="Hotel Customer Care",
-    instructions="""
+# Rough upper bound on how many tokens of hotel data go into one prompt
+MAX_HOTEL_CONTEXT_TOKENS = 800
+MAX_HOTELS_PER_PROMPT = 10
+
+STATIC_INSTRUCTIONS = """
     You are a helpful hotel customer care assistant. You have access to information about multiple hotels.
     
     Use the context provided to answer questions about specific hotels. The context may contain:
@@ -18,35 +29,62 @@ hotel_assistant = Agent(
     1. First identify which hotel the user is asking about from the context
     2. Use only the information provided in the context
     3. If information isn't available in context, politely inform the user
-    4. For room availability questions, calculate available rooms by subtracting special rooms from total rooms
+    4. For room availability questions, use available_rooms as given; it is kept up to date by our booking system
     5. Always confirm the location of the hotel when asked about it
-    "hotels": {
-        "hotel_sannata": {
-            "name": "Hotel Sannata",
-            "owner": "Mr. Ratan Lal",
-            "location": "karachi",
-            "total_rooms": 200,
-            "special_rooms": 20,
-            "available_rooms": 180
-        },
-        "hotel_paradise": {
-            "name": "Hotel Paradise",
-            "owner": "Ms. Sunita Sharma",
-            "location": "islamabad",
-            "total_rooms": 150,
-            "special_rooms": 10,
-            "available_rooms": 140
-        },
-        "hotel_queen": {
-            "name": "Hotel Queen",
-            "owner": "Ms. Sunita Sharma",
-            "location": "lahore",
-            "total_rooms": 150,
-            "special_rooms": 10,
-            "available_rooms": 140
-
-    """,
+    6. If a hotel you need is not listed below, look it up with lookup_hotel_by_name,
+       list_hotels_in_city or filter_hotels_by_available_rooms
+    7. To book rooms use reserve_rooms and give the user the booking id; to cancel use release_booking
+    """
+
+
+def estimate_tokens(text: str) -> int:
+    return len(text) // 4 + 1
+
+
+def relevant_hotels(ctx: RunContextWrapper[HotelContext], agent: Agent) -> str:
+    """Only the hotels relevant to the current query, within a token budget"""
+    store = ctx.context.store
+
+    rows = store.search(ctx.context.query, limit=MAX_HOTELS_PER_PROMPT)
+    if rows:
+        header = "Hotels relevant to this question:"
+    else:
+        # Nothing named in the query (e.g. "which hotels do you have?"), so list what fits
+        header = "No hotel was named in the question. Some hotels in our database:"
+        rows = store.rows(limit=MAX_HOTELS_PER_PROMPT)
+
+    lines = [header]
+    budget = MAX_HOTEL_CONTEXT_TOKENS - estimate_tokens(header)
+    for row in rows:
+        line = store.render(row)
+        budget -= estimate_tokens(line)
+        if budget < 0:
+            break
+        lines.append(line)
+
+    return "\n".join(lines)
+
+
+# Hotel data goes after the unchanging instructions so the provider can cache that prefix;
+# the text is rebuilt only when the query or any hotel's data has changed
+hotel_instructions = StableInstructions(
+    STATIC_INSTRUCTIONS,
+    dynamic=relevant_hotels,
+    version=lambda context: (context.store.revision, context.query),
+)
+
+
+hotel_assistant = Agent(
+    name="Hotel Customer Care",
+    instructions=hotel_instructions,
     model=MODEL,
+    tools=[
+        lookup_hotel_by_name,
+        list_hotels_in_city,
+        filter_hotels_by_available_rooms,
+        reserve_rooms,
+        release_booking,
+    ],
     input_guardrails=[guardrial_input_function],
     output_guardrails=[],
 )
\ No newline at end of file
@@ -1,9 +1,10 @@
 from decouple import config
-from agents import AsyncOpenAI, OpenAIChatCompletionsModel
+from model_client import get_client, get_model
 
 key = config("GEMINI_API_KEY")
 base_url = config("BASE_URL")
 
-gemini_client = AsyncOpenAI(api_key=key,base_url=base_url)
+# Shares one pooled keep-alive HTTP client with every other model in the process
+gemini_client = get_client(api_key=key, base_url=base_url)
 
-MODEL = OpenAIChatCompletionsModel(model="gemini-2.5-flash", openai_client=gemini_client)
+MODEL = get_model("gemini-2.5-flash", api_key=key, base_url=base_url)
@@ -0,0 +1,74 @@
+# hotel_tools.py
+from agents import RunContextWrapper, function_tool
+from context.hotel_context import HotelContext
+from context.reservations import ReservationError
+
+# Never hand the model more than this many hotels from one tool call
+MAX_TOOL_RESULTS = 20
+
+
+def render_rows(ctx: RunContextWrapper[HotelContext], rows: list[int], limit: int) -> str:
+    store = ctx.context.store
+    limit = max(1, min(limit, MAX_TOOL_RESULTS))
+    lines = [store.render(row) for row in rows[:limit]]
+    if len(rows) > limit:
+        lines.append(f"... and {len(rows) - limit} more")
+    return "\n".join(lines)
+
+
+@function_tool
+def lookup_hotel_by_name(ctx: RunContextWrapper[HotelContext], name: str) -> str:
+    """Get the details of one hotel by its name, e.g. "Hotel Sannata"."""
+    store = ctx.context.store
+    row = store.row_by_name(name)
+    if row is None:
+        # Fall back to the search index for partial or misspelled names
+        rows = store.search(name, limit=3)
+        if not rows:
+            return f"No hotel named {name!r} in our database."
+        return "No exact match. Closest hotels:\n" + render_rows(ctx, rows, 3)
+    return store.render(row)
+
+
+@function_tool
+def list_hotels_in_city(ctx: RunContextWrapper[HotelContext], city: str, limit: int = 10) -> str:
+    """List hotels located in a city, e.g. "karachi"."""
+    rows = ctx.context.store.rows_in_city(city)
+    if not rows:
+        return f"We have no hotels in {city}."
+    return render_rows(ctx, rows, limit)
+
+
+@function_tool
+def filter_hotels_by_available_rooms(
+    ctx: RunContextWrapper[HotelContext], min_rooms: int, city: str | None = None, limit: int = 10
+) -> str:
+    """List hotels with at least `min_rooms` rooms available, optionally only in one city. Most available first."""
+    rows = ctx.context.store.rows_with_available(min_rooms, city=city)
+    if not rows:
+        return f"No hotels with {min_rooms} or more available rooms."
+    return render_rows(ctx, rows, limit)
+
+
+@function_tool
+async def reserve_rooms(ctx: RunContextWrapper[HotelContext], hotel_name: str, rooms: int) -> str:
+    """Book `rooms` rooms at a hotel. Returns a booking id, or why the booking failed."""
+    try:
+        booking = await ctx.context.reservations.reserve(hotel_name, rooms)
+    except ReservationError as ex:
+        return f"Booking failed: {ex}"
+    store = ctx.context.store
+    return (
+        f"Booked {booking.rooms} room(s) at {store.names[booking.row]}. Booking id: {booking.booking_id}. "
+        f"{store.available_rooms[booking.row]} rooms left."
+    )
+
+
+@function_tool
+async def release_booking(ctx: RunContextWrapper[HotelContext], booking_id: str) -> str:
+    """Cancel a booking by its booking id and give its rooms back."""
+    try:
+        booking = await ctx.context.reservations.release(booking_id)
+    except ReservationError as ex:
+        return f"Cancellation failed: {ex}"
+    return f"Booking {booking.booking_id} cancelled, {booking.rooms} room(s) released."
@@ -0,0 +1,93 @@
+# analysis/lexicon.py
+import re
+from bisect import bisect_right
+from collections import defaultdict
+from typing import Iterable
+
+
+def _trie_pattern(terms: Iterable[str]) -> str:
+    """Regex alternation shaped like a trie, so the regex engine never re-reads a shared prefix"""
+    trie: dict = {}
+    for term in terms:
+        node = trie
+        for char in term:
+            node = node.setdefault(char, {})
+        node[""] = True
+
+    def build(node: dict) -> str:
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        if len(branches) == 1 and "" not in node:
+            return branches[0]
+        group = "(?:" + "|".join(branches) + ")"
+        # Greedy, so the longest term wins and shorter ones are only tried when it fails
+        return group + "?" if "" in node else group
+
+    return build(trie)
+
+
+class Lexicon:
+    """Every word list of the bot compiled into one regex, matched in a single pass per message.
+
+    Terms match at the start of a word and may carry a suffix ("thank" matches "thanks",
+    "order" matches "orders") but never inside another word ("hate" does not match "whatever").
+    """
+
+    def __init__(self, categories: dict[str, Iterable[str]]):
+        self.categories: dict[str, list[str]] = {}
+        owners: dict[str, set[str]] = defaultdict(set)
+        for category, terms in categories.items():
+            self.categories[category] = sorted({term.lower() for term in terms})
+            for term in self.categories[category]:
+                owners[term].add(category)
+
+        # A term that starts with another term also counts for that term's categories, reported
+        # as the category's own term: wherever "return policy" matches, "return" would have too
+        terms = sorted(owners)
+        self._owners: dict[str, tuple[tuple[str, str], ...]] = {}
+        for term in terms:
+            found: dict[str, str] = {}
+            # Shortest prefix first, so each category ends up with its longest term that matched
+            for end in range(1, len(term) + 1):
+                for category in owners.get(term[:end], ()):
+                    found[category] = term[:end]
+            self._owners[term] = tuple(sorted(found.items()))
+
+        self._pattern = re.compile(r"(?<!\w)(" + _trie_pattern(terms) + r")\w*") if terms else None
+
+    def match(self, text: str) -> dict[str, list[str]]:
+        """Terms found in `text`, per category, in the order they appear"""
+        hits: dict[str, list[str]] = {}
+        if self._pattern is None:
+            return hits
+        for found in self._pattern.finditer(text.lower()):
+            for category, term in self._owners[found.group(1)]:
+                hits.setdefault(category, []).append(term)
+        return hits
+
+    def match_many(self, texts: list[str]) -> list[dict[str, list[str]]]:
+        """`match` for many messages with one regex scan over all of them"""
+        results: list[dict[str, list[str]]] = [{} for _ in texts]
+        if self._pattern is None or not texts:
+            return results
+
+        # Offsets come from the lowercased pieces, since lowercasing can change a string's length
+        pieces = [text.lower().replace("\n", " ") for text in texts]
+        starts = []
+        offset = 0
+        for piece in pieces:
+            starts.append(offset)
+            offset += len(piece) + 1
+        # Newlines keep a term from running from one message into the next
+        joined = "\n".join(pieces)
+
+        for found in self._pattern.finditer(joined):
+            hits = results[bisect_right(starts, found.start()) - 1]
+            for category, term in self._owners[found.group(1)]:
+                hits.setdefault(category, []).append(term)
+        return results
+
+    def count(self, text: str) -> dict[str, int]:
+        """Number of distinct terms of each category in `text`"""
+        return {category: len(set(terms)) for category, terms in self.match(text).items()}
@@ -0,0 +1,21 @@
+# analysis/support_lexicon.py
+from analysis.lexicon import Lexicon
+
+NEGATIVE_WORDS = ["hate", "terrible", "awful", "horrible", "stupid", "suck", "angry", "pissed", "frustrated"]
+POSITIVE_WORDS = ["love", "great", "awesome", "fantastic", "wonderful", "thank", "appreciate", "helpful"]
+OFFENSIVE_TERMS = ["stupid", "idiot", "moron", "shit", "fuck", "asshole", "suck"]
+# Shorter list used by guardrails/sentiment_guard.py
+DISRESPECTFUL_WORDS = ["stupid", "idiot", "hate", "worst"]
+ORDER_KEYWORDS = ["order", "status", "tracking", "delivery"]
+HANDOFF_KEYWORDS = ["human", "agent", "representative", "manager", "supervisor"]
+COMPLEX_QUERIES = ["complaint", "refund", "return", "compensation", "lawsuit"]
+
+support_lexicon = Lexicon({
+    "negative": NEGATIVE_WORDS,
+    "positive": POSITIVE_WORDS,
+    "offensive": OFFENSIVE_TERMS,
+    "disrespectful": DISRESPECTFUL_WORDS,
+    "order": ORDER_KEYWORDS,
+    "handoff": HANDOFF_KEYWORDS,
+    "complex": COMPLEX_QUERIES,
+})
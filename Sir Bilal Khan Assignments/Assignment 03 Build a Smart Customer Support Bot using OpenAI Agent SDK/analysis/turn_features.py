@@ -0,0 +1,92 @@
+# analysis/turn_features.py
+import re
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Literal
+
+from analysis.support_lexicon import support_lexicon
+
+TOKEN_RE = re.compile(r"\w+")
+
+# Messages whose features are kept; every gate of one turn asks within microseconds of each other
+CACHE_SIZE = 1024
+
+Sentiment = Literal["positive", "neutral", "negative"]
+
+
+@dataclass(frozen=True)
+class TurnFeatures:
+    """Everything the guardrails, tool gates and handoff logic need to know about one user message"""
+    text: str
+    normalized: str
+    tokens: tuple[str, ...]
+    hits: dict[str, list[str]]
+    sentiment: Sentiment
+    elapsed: float = field(compare=False)
+
+    def has(self, category: str) -> bool:
+        return category in self.hits
+
+
+@dataclass
+class FeatureStats:
+    analyzed: int = 0
+    reused: int = 0
+    total_time: float = 0.0
+    max_time: float = 0.0
+
+    def summary(self) -> dict:
+        return {
+            "analyzed": self.analyzed,
+            "reused": self.reused,
+            "avg_us": round(self.total_time / self.analyzed * 1e6, 1) if self.analyzed else 0.0,
+            "max_us": round(self.max_time * 1e6, 1),
+        }
+
+
+_cache: OrderedDict[str, TurnFeatures] = OrderedDict()
+feature_stats = FeatureStats()
+
+
+def analyze(text: str) -> TurnFeatures:
+    """Normalize, tokenize and run the lexicon over `text` once"""
+    started = time.perf_counter()
+    normalized = " ".join(text.lower().split())
+    hits = support_lexicon.match(normalized)
+
+    negative_count = len(set(hits.get("negative", ())))
+    positive_count = len(set(hits.get("positive", ())))
+    if negative_count > positive_count:
+        sentiment = "negative"
+    elif positive_count > negative_count:
+        sentiment = "positive"
+    else:
+        sentiment = "neutral"
+
+    features = TurnFeatures(
+        text=text,
+        normalized=normalized,
+        tokens=tuple(TOKEN_RE.findall(normalized)),
+        hits=hits,
+        sentiment=sentiment,
+        elapsed=time.perf_counter() - started,
+    )
+    feature_stats.analyzed += 1
+    feature_stats.total_time += features.elapsed
+    feature_stats.max_time = max(feature_stats.max_time, features.elapsed)
+    return features
+
+
+def features_for(text: str) -> TurnFeatures:
+    """Features of a message, computed the first time any stage asks and shared after that"""
+    features = _cache.get(text)
+    if features is not None:
+        _cache.move_to_end(text)
+        feature_stats.reused += 1
+        return features
+
+    features = _cache[text] = analyze(text)
+    if len(_cache) > CACHE_SIZE:
+        _cache.popitem(last=False)
+    return features
@@ -0,0 +1,67 @@
+# bench_faq_index.py
+# Build time, search latency and add/remove cost of FaqIndex at 10k and 100k FAQs.
+# Run from the assignment folder:  python -m benchmarks.bench_faq_index [sizes...]
+import itertools
+import random
+import statistics
+import string
+import sys
+import time
+
+from knowledge.faq_index import FaqIndex
+
+VOCABULARY_SIZE = 20_000
+
+
+def make_vocabulary(rng: random.Random) -> list[str]:
+    return ["".join(rng.choices(string.ascii_lowercase, k=rng.randint(3, 9))) for _ in range(VOCABULARY_SIZE)]
+
+
+# Zipf word frequencies, like real text without stop words: a few words are everywhere, most are rare
+ZIPF_WEIGHTS = list(itertools.accumulate(1 / rank for rank in range(1, VOCABULARY_SIZE + 1)))
+
+
+def make_faq(rng: random.Random, vocabulary: list[str]) -> tuple[str, str]:
+    def words(count: int) -> str:
+        return " ".join(rng.choices(vocabulary, cum_weights=ZIPF_WEIGHTS, k=count))
+
+    return words(rng.randint(4, 10)), words(rng.randint(15, 40))
+
+
+def main() -> None:
+    sizes = [int(size) for size in sys.argv[1:]] or [10_000, 100_000]
+    rng = random.Random(3)
+    vocabulary = make_vocabulary(rng)
+
+    for size in sizes:
+        faqs = [make_faq(rng, vocabulary) for _ in range(size)]
+
+        started = time.perf_counter()
+        index = FaqIndex()
+        for i, (question, answer) in enumerate(faqs):
+            index.add(f"faq_{i}", question, answer)
+        build_time = time.perf_counter() - started
+
+        queries = [rng.choice(faqs)[0] for _ in range(200)]
+        latencies = []
+        for query in queries:
+            started = time.perf_counter()
+            index.search(query, k=5)
+            latencies.append(time.perf_counter() - started)
+        latencies.sort()
+
+        started = time.perf_counter()
+        for i in range(1000):
+            index.remove(f"faq_{i}")
+        for i in range(1000):
+            index.add(f"faq_{i}", *faqs[i])
+        churn = (time.perf_counter() - started) / 2000
+
+        print(f"{size} FAQs")
+        print(f"  build: {build_time:.2f}s ({build_time / size * 1e6:.0f} us/FAQ)")
+        print(f"  search p50: {statistics.median(latencies) * 1e3:.2f} ms  p95: {latencies[int(len(latencies) * 0.95)] * 1e3:.2f} ms")
+        print(f"  add/remove: {churn * 1e6:.0f} us/op")
+
+
+if __name__ == "__main__":
+    main()
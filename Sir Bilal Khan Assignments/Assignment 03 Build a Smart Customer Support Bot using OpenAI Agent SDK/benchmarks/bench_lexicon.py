@@ -0,0 +1,65 @@
+# bench_lexicon.py
+# Compiled Lexicon vs. the old lowercase-and-`in` loops, for growing word lists.
+# Run from the assignment folder:  python -m benchmarks.bench_lexicon
+import random
+import string
+import time
+
+from analysis.lexicon import Lexicon
+from analysis.support_lexicon import support_lexicon
+
+CATEGORIES = 7
+MESSAGES = [
+    "Thanks, the headphones are great but the delivery is late",
+    "I hate this, it's the worst service, let me talk to a human manager",
+    "What is the status of my order ORD12345?",
+    "Do you accept PayPal for payment?",
+    "This is stupid, I want a refund and compensation right now",
+]
+
+
+def random_terms(count: int, rng: random.Random) -> list[str]:
+    return ["".join(rng.choices(string.ascii_lowercase, k=rng.randint(4, 10))) for _ in range(count)]
+
+
+def loop_match(lists: dict[str, list[str]], text: str) -> dict[str, list[str]]:
+    # What main.py did before: lowercase again and scan every list with `in`
+    hits = {}
+    for category, terms in lists.items():
+        text_lower = text.lower()
+        found = [term for term in terms if term in text_lower]
+        if found:
+            hits[category] = found
+    return hits
+
+
+def timed(label: str, fn, repeat: int, messages: int) -> float:
+    started = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    per_message = (time.perf_counter() - started) / repeat / messages
+    print(f"  {label:<28} {per_message * 1e6:10.1f} us/message")
+    return per_message
+
+
+def main() -> None:
+    rng = random.Random(1)
+    for size in (50, 1_000, 10_000, 100_000):
+        lists = {f"category_{i}": random_terms(size // CATEGORIES, rng) for i in range(CATEGORIES)}
+        for category, terms in support_lexicon.categories.items():
+            lists.setdefault(category, []).extend(terms)
+
+        started = time.perf_counter()
+        lexicon = Lexicon(lists)
+        compile_time = time.perf_counter() - started
+        print(f"{size} terms (compile {compile_time:.2f}s)")
+
+        repeat = max(5, 20_000 // size)
+        loops = timed("loops", lambda: [loop_match(lists, m) for m in MESSAGES], repeat, len(MESSAGES))
+        compiled = timed("Lexicon.match", lambda: [lexicon.match(m) for m in MESSAGES], repeat * 50, len(MESSAGES))
+        timed("Lexicon.match_many", lambda: lexicon.match_many(MESSAGES * 20), repeat * 5, len(MESSAGES) * 20)
+        print(f"  speedup: {loops / compiled:.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+# bench_order_store.py
+# Lookup latency of OrderStore on a 1M-order SQLite database: cold, cached, batched and concurrent.
+# Run from the assignment folder:  python -m benchmarks.bench_order_store [orders] [db path]
+import asyncio
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+from orders.order_store import OrderStore
+
+STATUSES = ["Processing", "Shipped", "Delivered", "Returned"]
+ITEMS = ["Wireless Headphones", "Charging Cable", "Smart Watch", "Laptop Bag", "USB-C Adapter"]
+
+
+def order_id(i: int) -> str:
+    return f"ORD{i:07d}"
+
+
+async def fill(store: OrderStore, count: int) -> None:
+    rng = random.Random(5)
+    chunk = 50_000
+    for start in range(0, count, chunk):
+        await store.put_many(
+            {
+                "order_id": order_id(i),
+                "status": rng.choice(STATUSES),
+                "customer": f"Customer {i % 90_000}",
+                "items": rng.sample(ITEMS, rng.randint(1, 3)),
+            }
+            for i in range(start, min(start + chunk, count))
+        )
+
+
+def report(label: str, latencies: list[float]) -> None:
+    latencies.sort()
+    p99 = latencies[int(len(latencies) * 0.99)]
+    print(f"{label:<36} p50 {statistics.median(latencies) * 1e6:8.1f} us   p99 {p99 * 1e6:8.1f} us")
+
+
+async def run(count: int, path: str) -> None:
+    store = OrderStore(path, pool_size=4, cache_size=10_000)
+    if await store.count() < count:
+        started = time.perf_counter()
+        await fill(store, count)
+        print(f"filled {count} orders in {time.perf_counter() - started:.1f}s")
+
+    rng = random.Random(9)
+    ids = [order_id(rng.randrange(count)) for _ in range(2_000)]
+
+    latencies = []
+    for id_ in ids:
+        started = time.perf_counter()
+        await store.get(id_)
+        latencies.append(time.perf_counter() - started)
+    report("get, cold", latencies)
+
+    latencies = []
+    for id_ in ids:
+        started = time.perf_counter()
+        await store.get(id_)
+        latencies.append(time.perf_counter() - started)
+    report("get, cached", latencies)
+
+    batches = [[order_id(rng.randrange(count)) for _ in range(20)] for _ in range(200)]
+    latencies = []
+    for batch in batches:
+        started = time.perf_counter()
+        for id_ in batch:
+            await store.get(id_)
+        latencies.append(time.perf_counter() - started)
+    report("20 orders one by one, cold", latencies)
+
+    batches = [[order_id(rng.randrange(count)) for _ in range(20)] for _ in range(200)]
+    latencies = []
+    for batch in batches:
+        started = time.perf_counter()
+        await store.get_many(batch)
+        latencies.append(time.perf_counter() - started)
+    report("20 orders get_many, cold", latencies)
+
+    concurrent_ids = [order_id(rng.randrange(count)) for _ in range(20_000)]
+    started = time.perf_counter()
+    await asyncio.gather(*(store.get(id_) for id_ in concurrent_ids))
+    elapsed = time.perf_counter() - started
+    print(f"{len(concurrent_ids)} concurrent gets: {len(concurrent_ids) / elapsed:,.0f} lookups/s")
+    print(store.stats())
+    store.close()
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    path = sys.argv[2] if len(sys.argv) > 2 else os.path.join(tempfile.gettempdir(), f"bench_orders_{count}.db")
+    asyncio.run(run(count, path))
+
+
+if __name__ == "__main__":
+    main()
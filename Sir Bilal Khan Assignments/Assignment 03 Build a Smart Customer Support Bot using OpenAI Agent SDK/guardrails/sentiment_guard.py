@@ -1,11 +1,10 @@
 # guardrails/sentiment_guard.py
 from openai import guardrail
-
-NEGATIVE_WORDS = ["stupid", "idiot", "hate", "worst"]
+from analysis.turn_features import features_for
 
 @guardrail
 def sentiment_guard(query: str) -> str | None:
     """Detects offensive/negative language and rephrases or blocks"""
-    if any(word in query.lower() for word in NEGATIVE_WORDS):
+    if features_for(query).has("disrespectful"):
         return "⚠️ Please keep the conversation respectful. Try rephrasing your query."
     return None  # allow normal flow
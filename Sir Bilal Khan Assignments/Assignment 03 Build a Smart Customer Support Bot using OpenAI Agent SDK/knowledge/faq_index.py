@@ -0,0 +1,136 @@
+# knowledge/faq_index.py
+import heapq
+import json
+import math
+import re
+from dataclasses import dataclass
+from pathlib import Path
+
+TOKEN_RE = re.compile(r"\w+")
+
+# Words that appear in almost every question and would only add noise to the scores
+STOP_WORDS = frozenset(
+    "a an and are as at be by can do does for from how i in is it me my of on or the to what when "
+    "where which who why will with you your".split()
+)
+
+# Question words count this many times, an FAQ is mostly found by what it asks
+QUESTION_BOOST = 2
+
+# Words in more than this share of FAQs barely move the ranking but cost a full postings scan,
+# so they are skipped whenever the query also has a rarer word
+COMMON_SHARE = 0.2
+COMMON_MIN_FAQS = 1000
+
+
+def tokenize(text: str) -> list[str]:
+    tokens = []
+    for token in TOKEN_RE.findall(text.lower()):
+        if token in STOP_WORDS:
+            continue
+        # Fold simple plurals so "returns" finds "return"
+        if len(token) > 3 and token.endswith("s") and not token.endswith("ss"):
+            token = token[:-1]
+        tokens.append(token)
+    return tokens
+
+
+@dataclass
+class FaqHit:
+    faq_id: str
+    question: str
+    answer: str
+    score: float
+
+
+class FaqIndex:
+    """BM25 inverted index over FAQ questions and answers, with add/remove while serving"""
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self._faqs: dict[str, tuple[str, str]] = {}
+        self._postings: dict[str, dict[str, int]] = {}
+        self._lengths: dict[str, int] = {}
+        self._total_length = 0
+
+    def __len__(self) -> int:
+        return len(self._faqs)
+
+    def add(self, faq_id: str, question: str, answer: str) -> None:
+        if faq_id in self._faqs:
+            self.remove(faq_id)
+        self._faqs[faq_id] = (question, answer)
+
+        counts: dict[str, int] = {}
+        tokens = tokenize(question) * QUESTION_BOOST + tokenize(answer)
+        for token in tokens:
+            counts[token] = counts.get(token, 0) + 1
+        for token, count in counts.items():
+            self._postings.setdefault(token, {})[faq_id] = count
+        self._lengths[faq_id] = len(tokens)
+        self._total_length += len(tokens)
+
+    def remove(self, faq_id: str) -> None:
+        question, answer = self._faqs.pop(faq_id)
+        for token in set(tokenize(question) + tokenize(answer)):
+            postings = self._postings.get(token)
+            if postings is not None:
+                postings.pop(faq_id, None)
+                if not postings:
+                    del self._postings[token]
+        self._total_length -= self._lengths.pop(faq_id)
+
+    def search(self, query: str, k: int = 3) -> list[FaqHit]:
+        """Top `k` FAQs by BM25 score, best first"""
+        if not self._faqs:
+            return []
+        count = len(self._faqs)
+        average_length = self._total_length / count
+        k1, b = self.k1, self.b
+
+        matched = [postings for token in set(tokenize(query)) if (postings := self._postings.get(token))]
+        matched.sort(key=len)
+        common = max(COMMON_MIN_FAQS, count * COMMON_SHARE)
+
+        scores: dict[str, float] = {}
+        lengths = self._lengths
+        for position, postings in enumerate(matched):
+            if position and len(postings) > common:
+                break
+            idf = math.log(1 + (count - len(postings) + 0.5) / (len(postings) + 0.5))
+            for faq_id, frequency in postings.items():
+                norm = k1 * (1 - b + b * lengths[faq_id] / average_length)
+                scores[faq_id] = scores.get(faq_id, 0.0) + idf * frequency * (k1 + 1) / (frequency + norm)
+
+        best = heapq.nlargest(k, scores.items(), key=lambda item: item[1])
+        return [FaqHit(faq_id, *self._faqs[faq_id], round(score, 4)) for faq_id, score in best]
+
+    @classmethod
+    def from_dict(cls, faqs: dict[str, str]) -> "FaqIndex":
+        """Index from {question: answer}, the shape of PRODUCT_FAQS"""
+        index = cls()
+        for question, answer in faqs.items():
+            index.add(question, question, answer)
+        return index
+
+    @classmethod
+    def load(cls, path: str | Path) -> "FaqIndex":
+        """Index from a .json file ({question: answer} or a list of FAQs) or a .jsonl file, one FAQ per line.
+
+        FAQ records have "question" and "answer" and an optional "id" (defaults to the question).
+        """
+        path = Path(path)
+        with path.open(encoding="utf-8") as file:
+            if path.suffix == ".jsonl":
+                records = [json.loads(line) for line in file if line.strip()]
+            else:
+                data = json.load(file)
+                if isinstance(data, dict):
+                    return cls.from_dict(data)
+                records = data
+
+        index = cls()
+        for record in records:
+            index.add(str(record.get("id", record["question"])), record["question"], record["answer"])
+        return index
@@ -0,0 +1,103 @@
+# knowledge/fast_path.py
+import re
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Literal
+
+from analysis.turn_features import TurnFeatures
+from knowledge.faq_index import FaqIndex
+from orders.order_store import ORDER_ID_RE
+
+POLICY_RE = re.compile(r"\bpolic(?:y|ies)\b")
+
+# "complex" words that a policy question may use without the customer needing a person
+POLICY_TOPICS = {"return", "refund"}
+
+
+@dataclass
+class FastAnswer:
+    intent: Literal["faq", "order"]
+    text: str
+    confidence: float
+
+
+class FastPath:
+    """Answers turns that an FAQ or an order lookup settles exactly, without calling the model.
+
+    An FAQ is only used when its BM25 score reaches `min_faq_score` and beats the runner-up by
+    `min_faq_margin` times; an order is only answered when the customer asks about its status (an
+    "order" keyword, nothing upset or asking for a person) and every order id in the message is known.
+    Anything less certain returns None and goes to the agent as before. Complex turns (refunds,
+    returns, complaints) are left to the agent and its handoff, except a plain policy question
+    like "what is your return policy?", which may still be answered from the FAQs.
+    """
+
+    def __init__(
+        self,
+        faq_index: FaqIndex,
+        order_statuses: Callable[[list[str]], Awaitable[dict[str, str | None]]],
+        min_faq_score: float = 3.0,
+        min_faq_margin: float = 1.5,
+    ):
+        self.faq_index = faq_index
+        self.order_statuses = order_statuses
+        self.min_faq_score = min_faq_score
+        self.min_faq_margin = min_faq_margin
+
+        self.turns = 0
+        self.served_faq = 0
+        self.served_order = 0
+
+    async def answer(self, features: TurnFeatures) -> FastAnswer | None:
+        self.turns += 1
+        if features.has("complex"):
+            answer = self._faq(features) if self._asks_policy(features) else None
+        elif ORDER_ID_RE.search(features.normalized):
+            # A message about a specific order is never answered with a generic FAQ
+            answer = await self._order(features)
+        else:
+            answer = self._faq(features)
+        if answer is not None:
+            if answer.intent == "order":
+                self.served_order += 1
+            else:
+                self.served_faq += 1
+        return answer
+
+    def stats(self) -> dict:
+        served = self.served_faq + self.served_order
+        return {
+            "turns": self.turns,
+            "served_faq": self.served_faq,
+            "served_order": self.served_order,
+            "served_without_llm": round(served / self.turns, 3) if self.turns else 0.0,
+        }
+
+    def _asks_policy(self, features: TurnFeatures) -> bool:
+        return (
+            POLICY_RE.search(features.normalized) is not None
+            and set(features.hits["complex"]) <= POLICY_TOPICS
+            and not ORDER_ID_RE.search(features.normalized)
+        )
+
+    async def _order(self, features: TurnFeatures) -> FastAnswer | None:
+        # "cancel ORD12345" or "this is terrible, where is my order" need the agent, not a status line
+        if not features.has("order") or any(features.has(c) for c in ("handoff", "negative", "offensive")):
+            return None
+        order_ids = list(dict.fromkeys(ORDER_ID_RE.findall(features.normalized)))
+        if not order_ids:
+            return None
+        # One batched lookup however many orders the message names
+        statuses = list((await self.order_statuses(order_ids)).values())
+        if any(status is None for status in statuses):
+            # Unknown id: let the agent ask the customer to check it
+            return None
+        return FastAnswer("order", "\n".join(statuses), 1.0)
+
+    def _faq(self, features: TurnFeatures) -> FastAnswer | None:
+        hits = self.faq_index.search(features.normalized, k=2)
+        if not hits or hits[0].score < self.min_faq_score:
+            return None
+        if len(hits) > 1 and hits[0].score < hits[1].score * self.min_faq_margin:
+            return None
+        confidence = 1.0 if len(hits) == 1 else 1 - hits[1].score / hits[0].score
+        return FastAnswer("faq", hits[0].answer, round(confidence, 3))
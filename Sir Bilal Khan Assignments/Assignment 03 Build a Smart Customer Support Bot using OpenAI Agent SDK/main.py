@@ -1,12 +1,20 @@
 import os
+import asyncio
 import logging
-from typing import Dict, Any, Literal, Optional
+import time
+from typing import Dict, Any, List, Literal, Optional
 from dotenv import load_dotenv
 from openai import OpenAI
 from openai.agents.agent import Agent, Runner
 from openai.agents.conversation import Turn
 from openai.agents.tools import function_tool, guardrail
 from openai.types import ModelSettings
+from analysis.turn_features import feature_stats, features_for
+from knowledge.faq_index import FaqIndex
+from knowledge.fast_path import FastPath
+from orders.order_db import order_store, seed_orders
+from server.sessions import SupportSession
+from transcripts.transcript_writer import TranscriptWriter
 
 # Load environment variables
 load_dotenv()
@@ -25,13 +33,6 @@ logger = logging.getLogger(__name__)
 # Initialize OpenAI client
 client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
 
-# Simulated order database
-ORDERS = {
-    "ORD12345": {"status": "Shipped", "items": ["Wireless Headphones", "Charging Cable"], "customer": "John Doe"},
-    "ORD67890": {"status": "Processing", "items": ["Smart Watch"], "customer": "Jane Smith"},
-    "ORD11121": {"status": "Delivered", "items": ["Laptop Bag", "USB-C Adapter"], "customer": "Robert Johnson"}
-}
-
 # Product FAQs knowledge base
 PRODUCT_FAQS = {
     "return policy": "We offer a 30-day return policy on all unused items with original packaging.",
@@ -41,69 +42,91 @@ PRODUCT_FAQS = {
     "contact support": "You can reach our support team at support@example.com or 1-800-123-4567 from 9AM to 5PM EST."
 }
 
+# The full FAQ corpus can be loaded from a .json/.jsonl file, PRODUCT_FAQS is the built-in fallback
+FAQ_PATH = os.getenv("FAQ_PATH")
+faq_index = FaqIndex.load(FAQ_PATH) if FAQ_PATH else FaqIndex.from_dict(PRODUCT_FAQS)
+
+# Below this BM25 score a hit shares only a weak word with the question
+FAQ_MIN_SCORE = float(os.getenv("FAQ_MIN_SCORE", "1.0"))
+
 class SentimentAnalyzer:
     """Simple sentiment analysis for guardrails"""
     
     @staticmethod
     def analyze(text: str) -> Literal["positive", "neutral", "negative"]:
-        text_lower = text.lower()
-        
-        negative_words = ["hate", "terrible", "awful", "horrible", "stupid", "suck", "angry", "pissed", "frustrated"]
-        positive_words = ["love", "great", "awesome", "fantastic", "wonderful", "thank", "appreciate", "helpful"]
-        
-        negative_count = sum(1 for word in negative_words if word in text_lower)
-        positive_count = sum(1 for word in positive_words if word in text_lower)
-        
-        if negative_count > positive_count:
-            return "negative"
-        elif positive_count > negative_count:
-            return "positive"
-        else:
-            return "neutral"
+        return features_for(text).sentiment
 
 # Guardrail to check for offensive language
 @guardrail
 def check_offensive_language(turn: Turn) -> Optional[str]:
     """Guardrail to detect and handle offensive language"""
-    offensive_terms = ["stupid", "idiot", "moron", "shit", "fuck", "asshole", "suck"]
-    user_message = turn.user_message.content.lower()
+    offensive = features_for(turn.user_message.content).hits.get("offensive")
     
-    for term in offensive_terms:
-        if term in user_message:
-            logger.warning(f"Offensive language detected: {term}")
-            return "I understand you're frustrated, but please maintain a respectful tone. How can I help resolve your issue?"
+    if offensive:
+        logger.warning(f"Offensive language detected: {offensive[0]}")
+        return "I understand you're frustrated, but please maintain a respectful tone. How can I help resolve your issue?"
     
     return None
 
 # Function tool with advanced features
 @function_tool(
-    is_enabled=lambda turn: any(keyword in turn.user_message.content.lower() 
-                               for keyword in ["order", "status", "tracking", "delivery"]),
+    is_enabled=lambda turn: features_for(turn.user_message.content).has("order"),
     error_function=lambda turn, error: f"I couldn't find that order. Please check your order ID and try again."
 )
-def get_order_status(order_id: str) -> str:
+async def get_order_status(order_id: str) -> str:
     """Get the status of an order by its ID"""
     logger.info(f"Fetching status for order: {order_id}")
     
-    if order_id.upper() in ORDERS:
-        order = ORDERS[order_id.upper()]
-        items = ", ".join(order["items"])
-        return f"Order {order_id.upper()} for {order['customer']} is currently {order['status']}. Items: {items}."
-    else:
+    order = await order_store.get(order_id)
+    if order is None:
         raise ValueError(f"Order {order_id} not found in our system")
+    return order_status_text(order)
+
+@function_tool(
+    is_enabled=lambda turn: features_for(turn.user_message.content).has("order"),
+)
+async def get_orders_status(order_ids: List[str]) -> str:
+    """Get the status of several orders at once, for questions about more than one order"""
+    logger.info(f"Fetching status for orders: {order_ids}")
+    
+    orders = await order_store.get_many(order_ids)
+    return "\n".join(
+        order_status_text(order) if order else f"Order {order_id} was not found in our system."
+        for order_id, order in orders.items()
+    )
+
+def order_status_text(order: Dict[str, Any]) -> str:
+    """One line describing an order from the order store"""
+    items = ", ".join(order["items"]) or "none listed"
+    customer = f" for {order['customer']}" if order["customer"] else ""
+    return f"Order {order['order_id']}{customer} is currently {order['status']}. Items: {items}."
 
 @function_tool
 def search_faqs(query: str) -> str:
     """Search for answers to frequently asked questions"""
     logger.info(f"Searching FAQs for: {query}")
-    query_lower = query.lower()
+    hits = [hit for hit in faq_index.search(query, k=3) if hit.score >= FAQ_MIN_SCORE]
     
-    for keyword, answer in PRODUCT_FAQS.items():
-        if keyword in query_lower:
-            return answer
+    if hits:
+        answer = hits[0].answer
+        if len(hits) > 1:
+            answer += "\n\nRelated answers:\n" + "\n".join(f"- {hit.answer}" for hit in hits[1:])
+        return answer
     
     return "I couldn't find a specific answer to your question. Would you like to speak with a human agent for more assistance?"
 
+async def lookup_order_statuses(order_ids: List[str]) -> Dict[str, Optional[str]]:
+    orders = await order_store.get_many(order_ids)
+    return {order_id: order_status_text(order) if order else None for order_id, order in orders.items()}
+
+# Turns an exact FAQ or order lookup can answer skip the model entirely
+fast_path = FastPath(
+    faq_index,
+    lookup_order_statuses,
+    min_faq_score=float(os.getenv("FAST_PATH_FAQ_SCORE", "3.0")),
+    min_faq_margin=float(os.getenv("FAST_PATH_FAQ_MARGIN", "1.5")),
+)
+
 class BotAgent(Agent):
     def __init__(self):
         super().__init__(
@@ -117,12 +140,12 @@ class BotAgent(Agent):
                     "department": "customer_support"
                 }
             ),
-            tools=[get_order_status, search_faqs],
+            tools=[get_order_status, get_orders_status, search_faqs],
             instructions="""You are a friendly customer support bot for TechGadgets Inc.
             
             Your capabilities:
             1. Answer product and service FAQs using the search_faqs tool
-            2. Check order status using the get_order_status tool
+            2. Check order status using the get_order_status tool, or get_orders_status for several orders
             3. Escalate to human support when needed
             
             Guidelines:
@@ -135,18 +158,13 @@ class BotAgent(Agent):
     
     def should_handoff(self, turn: Turn) -> bool:
         """Determine if a conversation should be handed off to a human"""
-        sentiment = SentimentAnalyzer.analyze(turn.user_message.content)
+        features = features_for(turn.user_message.content)
         
         # Handoff conditions
-        handoff_keywords = ["human", "agent", "representative", "manager", "supervisor"]
-        contains_handoff_keyword = any(keyword in turn.user_message.content.lower() 
-                                      for keyword in handoff_keywords)
+        contains_handoff_keyword = features.has("handoff")
+        is_complex_query = features.has("complex")
         
-        complex_queries = ["complaint", "refund", "return", "compensation", "lawsuit"]
-        is_complex_query = any(keyword in turn.user_message.content.lower() 
-                              for keyword in complex_queries)
-        
-        return (sentiment == "negative" or contains_handoff_keyword or is_complex_query)
+        return (features.sentiment == "negative" or contains_handoff_keyword or is_complex_query)
 
 class HumanAgent(Agent):
     def __init__(self):
@@ -170,62 +188,110 @@ class HumanAgent(Agent):
             - If you can't resolve an issue immediately, promise a callback or email follow-up"""
         )
 
-def main():
+bot_agent = BotAgent()
+human_agent = HumanAgent()
+
+# Every turn of every session, streamed to disk as JSONL instead of dumped at the end
+transcripts = TranscriptWriter(
+    os.getenv("TRANSCRIPT_DIR", "logs/transcripts"),
+    max_bytes=int(os.getenv("TRANSCRIPT_MAX_BYTES", "50000000")),
+    max_age=float(os.getenv("TRANSCRIPT_MAX_AGE", "86400")),
+    compress=os.getenv("TRANSCRIPT_COMPRESS", "1") == "1",
+)
+
+# Upper bound on model calls running at once across every session
+model_slots = asyncio.Semaphore(int(os.getenv("MAX_CONCURRENT_RUNS", "32")))
+
+async def reply_to(session: SupportSession, user_input: str) -> str:
+    """The support reply to one customer message"""
+    # Create conversation turn
+    turn = Turn(user_message={"role": "user", "content": user_input})
+    
+    # Analyze the message once; every check below reuses these features
+    features = features_for(user_input)
+    logger.debug(f"Turn preprocessing took {features.elapsed * 1e6:.0f}us")
+    
+    # Check for offensive language first
+    offensive_check = check_offensive_language(turn)
+    if offensive_check:
+        return offensive_check
+    
+    # Answer locally when the FAQs or order data settle the question, unless the
+    # customer is upset or asked for a person
+    if session.agent == "bot" and features.sentiment != "negative" and not features.has("handoff"):
+        fast_answer = await fast_path.answer(features)
+        if fast_answer:
+            logger.info(f"Answered without LLM ({fast_answer.intent}, confidence {fast_answer.confidence})")
+            return fast_answer.text
+    
+    # Determine which agent to use; once handed off, the customer stays with the human agent
+    notice = ""
+    if session.agent == "bot" and bot_agent.should_handoff(turn):
+        logger.info(f"Handing off session {session.session_id} to human agent")
+        session.agent = "human"
+        notice = "I'm connecting you with a human support agent...\n"
+    agent = human_agent if session.agent == "human" else bot_agent
+    
+    # Runner.run blocks, so it runs in a thread and other sessions keep going
+    async with model_slots:
+        response = await asyncio.to_thread(Runner.run, agent, turn)
+    
+    # Get the response
+    return notice + response.messages[-1].content
+
+async def handle_turn(session: SupportSession, user_input: str) -> str:
+    """Reply to one message of a session and record both in its history and the transcript"""
+    started = time.perf_counter()
+    session.history.append(f"Customer: {user_input}")
+    support_response = await reply_to(session, user_input)
+    session.history.append(f"Support: {support_response}")
+    transcripts.write({
+        "session_id": session.session_id,
+        "turn": session.turns + 1,
+        "agent": session.agent,
+        "customer": user_input,
+        "support": support_response,
+        "latency_s": round(time.perf_counter() - started, 3),
+    })
+    return support_response
+
+async def main():
     """Run the customer support bot"""
     logger.info("Starting customer support bot")
-    
-    # Initialize agents
-    bot_agent = BotAgent()
-    human_agent = HumanAgent()
+    await seed_orders()
+    await transcripts.start()
     
     print("=" * 50)
     print("TechGadgets Inc. Customer Support")
     print("Type 'exit' at any time to end the conversation")
     print("=" * 50)
     
-    # Conversation history
-    conversation_history = []
+    session = SupportSession("console")
     
     while True:
         try:
-            user_input = input("\nCustomer: ").strip()
+            # input() blocks, so it waits in a thread and the order store keeps the loop to itself
+            user_input = (await asyncio.to_thread(input, "\nCustomer: ")).strip()
             
             if user_input.lower() == 'exit':
                 print("Thank you for contacting TechGadgets support. Have a great day!")
                 break
             
-            # Create conversation turn
-            turn = Turn(user_message={"role": "user", "content": user_input})
-            
-            # Add to conversation history
-            conversation_history.append(f"Customer: {user_input}")
-            
-            # Check for offensive language first
-            offensive_check = check_offensive_language(turn)
-            if offensive_check:
-                print(f"Support: {offensive_check}")
-                conversation_history.append(f"Support: {offensive_check}")
-                continue
-            
-            # Determine which agent to use
-            if bot_agent.should_handoff(turn):
-                logger.info("Handing off to human agent")
-                print("Support: I'm connecting you with a human support agent...")
-                response = Runner.run(human_agent, turn)
-            else:
-                response = Runner.run(bot_agent, turn)
-            
-            # Get the response
-            support_response = response.messages[-1].content
+            support_response = await handle_turn(session, user_input)
+            session.turns += 1
             print(f"Support: {support_response}")
-            conversation_history.append(f"Support: {support_response}")
             
         except Exception as e:
             logger.error(f"Error in conversation: {str(e)}")
             print("Support: I'm experiencing technical difficulties. Please try again in a moment.")
     
-    # Log the entire conversation
-    logger.info("Conversation ended. Full transcript:\n" + "\n".join(conversation_history))
+    logger.info(f"Turn preprocessing: {feature_stats.summary()}")
+    logger.info(f"Fast path: {fast_path.stats()}")
+    logger.info(f"Order store: {order_store.stats()}")
+    order_store.close()
+    await transcripts.close()
+    
+    logger.info(f"Conversation ended after {session.turns} turns, transcript in {transcripts.active_path}")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    asyncio.run(main())
\ No newline at end of file
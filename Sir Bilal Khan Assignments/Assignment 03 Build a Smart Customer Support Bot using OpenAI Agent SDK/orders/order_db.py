@@ -0,0 +1,26 @@
+# orders/order_db.py
+import os
+
+from orders.order_store import OrderStore
+
+# Seed data so a fresh database answers the same orders the bot always knew about
+SEED_ORDERS = [
+    {"order_id": "ORD12345", "status": "Shipped", "items": ["Wireless Headphones", "Charging Cable"], "customer": "John Doe"},
+    {"order_id": "ORD67890", "status": "Processing", "items": ["Smart Watch"], "customer": "Jane Smith"},
+    {"order_id": "ORD11121", "status": "Delivered", "items": ["Laptop Bag", "USB-C Adapter"], "customer": "Robert Johnson"},
+    {"order_id": "123", "status": "Shipped"},
+    {"order_id": "456", "status": "Processing"},
+    {"order_id": "789", "status": "Delivered"},
+]
+
+order_store = OrderStore(
+    os.getenv("ORDER_DB_PATH", "orders.db"),
+    pool_size=int(os.getenv("ORDER_DB_POOL_SIZE", "4")),
+    cache_size=int(os.getenv("ORDER_CACHE_SIZE", "10000")),
+)
+
+
+async def seed_orders() -> None:
+    """Fill an empty database with SEED_ORDERS"""
+    if await order_store.count() == 0:
+        await order_store.put_many(SEED_ORDERS)
@@ -0,0 +1,166 @@
+# orders/order_store.py
+import asyncio
+import json
+import queue
+import re
+import sqlite3
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterable
+
+# Order ids as customers type them: "ORD" followed by any number of digits, e.g. ORD12345 or ORD1234567
+ORDER_ID_RE = re.compile(r"\bord\d+\b", re.IGNORECASE)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS orders (
+    order_id TEXT PRIMARY KEY,
+    status TEXT NOT NULL,
+    customer TEXT,
+    items TEXT NOT NULL
+) WITHOUT ROWID
+"""
+
+SELECT_ONE = "SELECT order_id, status, customer, items FROM orders WHERE order_id = ?"
+UPSERT = "INSERT OR REPLACE INTO orders (order_id, status, customer, items) VALUES (?, ?, ?, ?)"
+
+# Batched lookups are padded up to one of these sizes so SQLite only ever sees a handful of
+# distinct statements and every one of them stays in the prepared statement cache
+BATCH_SIZES = (1, 4, 16, 64, 256)
+
+
+def _select_many(size: int) -> str:
+    return f"SELECT order_id, status, customer, items FROM orders WHERE order_id IN ({', '.join('?' * size)})"
+
+
+SELECT_MANY = {size: _select_many(size) for size in BATCH_SIZES}
+
+
+def _row_to_order(row: tuple) -> dict:
+    order_id, status, customer, items = row
+    return {"order_id": order_id, "status": status, "customer": customer, "items": json.loads(items)}
+
+
+class OrderStore:
+    """Orders in SQLite, read from async code without blocking the event loop.
+
+    Queries run on a small thread pool, each thread borrowing one of `pool_size` connections.
+    A read-through LRU cache of `cache_size` orders sits in front; it is only touched from the
+    event loop thread, so it needs no lock. Order ids are case-insensitive and stored upper case.
+    """
+
+    def __init__(self, path: str, pool_size: int = 4, cache_size: int = 10_000):
+        self.path = path
+        self.pool_size = pool_size
+        self.cache_size = cache_size
+        self._connections: queue.Queue[sqlite3.Connection] = queue.Queue()
+        for _ in range(pool_size):
+            self._connections.put(self._connect())
+        self._executor = ThreadPoolExecutor(max_workers=pool_size, thread_name_prefix="order-store")
+        self._cache: OrderedDict[str, dict] = OrderedDict()
+
+        self.hits = 0
+        self.misses = 0
+        self.queries = 0
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self.path, check_same_thread=False, cached_statements=64)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.execute(SCHEMA)
+        connection.commit()
+        return connection
+
+    async def _run(self, work: Callable[[sqlite3.Connection], Any]) -> Any:
+        def borrow() -> Any:
+            connection = self._connections.get()
+            try:
+                return work(connection)
+            finally:
+                self._connections.put(connection)
+
+        self.queries += 1
+        return await asyncio.get_running_loop().run_in_executor(self._executor, borrow)
+
+    async def get(self, order_id: str) -> dict | None:
+        order_id = order_id.upper()
+        order = self._cached(order_id)
+        if order is not None:
+            return order
+
+        row = await self._run(lambda connection: connection.execute(SELECT_ONE, (order_id,)).fetchone())
+        if row is None:
+            return None
+        return self._remember(_row_to_order(row))
+
+    async def get_many(self, order_ids: Iterable[str]) -> dict[str, dict | None]:
+        """Orders by id (None for unknown ids), fetching everything not cached in as few queries as possible"""
+        wanted = list(dict.fromkeys(order_id.upper() for order_id in order_ids))
+        found: dict[str, dict | None] = {}
+        missing = []
+        for order_id in wanted:
+            order = self._cached(order_id)
+            if order is not None:
+                found[order_id] = order
+            else:
+                missing.append(order_id)
+
+        largest = BATCH_SIZES[-1]
+        for start in range(0, len(missing), largest):
+            chunk = missing[start:start + largest]
+            size = next(size for size in BATCH_SIZES if size >= len(chunk))
+            params = chunk + [chunk[-1]] * (size - len(chunk))
+            rows = await self._run(lambda connection: connection.execute(SELECT_MANY[size], params).fetchall())
+            for row in rows:
+                order = self._remember(_row_to_order(row))
+                found[order["order_id"]] = order
+
+        return {order_id: found.get(order_id) for order_id in wanted}
+
+    async def put_many(self, orders: Iterable[dict]) -> int:
+        rows = [
+            (order["order_id"].upper(), order["status"], order.get("customer"), json.dumps(order.get("items", [])))
+            for order in orders
+        ]
+
+        def write(connection: sqlite3.Connection) -> int:
+            with connection:
+                connection.executemany(UPSERT, rows)
+            return len(rows)
+
+        count = await self._run(write)
+        for row in rows:
+            self._cache.pop(row[0], None)
+        return count
+
+    async def count(self) -> int:
+        return await self._run(lambda connection: connection.execute("SELECT COUNT(*) FROM orders").fetchone()[0])
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "cached": len(self._cache),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            "queries": self.queries,
+        }
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=True)
+        while not self._connections.empty():
+            self._connections.get().close()
+
+    def _cached(self, order_id: str) -> dict | None:
+        order = self._cache.get(order_id)
+        if order is None:
+            self.misses += 1
+            return None
+        self._cache.move_to_end(order_id)
+        self.hits += 1
+        return order
+
+    def _remember(self, order: dict) -> dict:
+        self._cache[order["order_id"]] = order
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return order
@@ -0,0 +1,168 @@
+# server/session_server.py
+# Serves many customers at once over JSON lines, on a local TCP socket or on stdin/stdout.
+#
+#   python -m server.session_server --port 8765      one JSON object per line per connection
+#   python -m server.session_server --stdio          same protocol on stdin/stdout
+#
+# Requests:  {"session_id": "c1", "message": "where is ORD12345?"}
+#            {"session_id": "c1", "op": "end"}      {"op": "stats"}
+# Replies:   {"session_id": "c1", "reply": "...", "agent": "bot", "latency_s": 0.01}
+import argparse
+import asyncio
+import json
+import logging
+import os
+import sys
+import time
+
+from main import fast_path, handle_turn, order_store, seed_orders, transcripts
+from server.sessions import SessionBusy, SessionManager
+
+logger = logging.getLogger(__name__)
+
+# How often idle sessions are looked for
+SWEEP_INTERVAL = 30.0
+
+
+class SessionServer:
+    def __init__(self, sessions: SessionManager):
+        self.sessions = sessions
+
+    async def handle(self, request: dict) -> dict:
+        op = request.get("op", "message")
+        if op == "stats":
+            return {"stats": self.stats()}
+
+        session_id = str(request.get("session_id", ""))
+        if not session_id:
+            return {"error": "session_id is required"}
+        if op == "end":
+            session = self.sessions.end(session_id)
+            return {"session_id": session_id, "ended": session is not None}
+
+        message = str(request.get("message", "")).strip()
+        if not message:
+            return {"session_id": session_id, "error": "message is required"}
+
+        started = time.perf_counter()
+        session = self.sessions.get(session_id)
+        try:
+            reply = await self.sessions.run_turn(session_id, handle_turn, message)
+        except SessionBusy as ex:
+            return {"session_id": session_id, "error": str(ex)}
+        except Exception as ex:
+            logger.error(f"Error in session {session_id}: {ex}")
+            reply = "I'm experiencing technical difficulties. Please try again in a moment."
+        return {
+            "session_id": session_id,
+            "reply": reply,
+            "agent": session.agent,
+            "latency_s": round(time.perf_counter() - started, 4),
+        }
+
+    def stats(self) -> dict:
+        return {
+            **self.sessions.stats(),
+            "fast_path": fast_path.stats(),
+            "order_store": order_store.stats(),
+            "transcripts": transcripts.stats(),
+        }
+
+    async def serve_lines(self, lines, write) -> None:
+        """Answer every request line as it finishes; requests of different sessions run concurrently"""
+        pending: set[asyncio.Task] = set()
+
+        async def answer(line: bytes) -> None:
+            try:
+                request = json.loads(line)
+            except json.JSONDecodeError:
+                response = {"error": "invalid JSON"}
+            else:
+                response = await self.handle(request)
+            await write(json.dumps(response, ensure_ascii=False).encode() + b"\n")
+
+        async for line in lines:
+            if line.strip():
+                task = asyncio.create_task(answer(line))
+                pending.add(task)
+                task.add_done_callback(pending.discard)
+        if pending:
+            await asyncio.gather(*pending)
+
+    async def sweep(self) -> None:
+        while True:
+            await asyncio.sleep(SWEEP_INTERVAL)
+            evicted = self.sessions.evict_idle()
+            if evicted:
+                logger.info(f"Evicted {len(evicted)} idle sessions, {self.stats()}")
+
+
+async def read_lines(reader: asyncio.StreamReader):
+    while line := await reader.readline():
+        yield line
+
+
+async def serve_tcp(server: SessionServer, host: str, port: int) -> None:
+    async def connection(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        lock = asyncio.Lock()
+
+        async def write(data: bytes) -> None:
+            async with lock:
+                writer.write(data)
+                await writer.drain()
+
+        try:
+            await server.serve_lines(read_lines(reader), write)
+        finally:
+            writer.close()
+
+    tcp = await asyncio.start_server(connection, host, port)
+    logger.info(f"Support session server listening on {host}:{port}")
+    async with tcp:
+        await tcp.serve_forever()
+
+
+async def serve_stdio(server: SessionServer) -> None:
+    loop = asyncio.get_running_loop()
+    reader = asyncio.StreamReader()
+    await loop.connect_read_pipe(lambda: asyncio.StreamReaderProtocol(reader), sys.stdin)
+
+    async def write(data: bytes) -> None:
+        sys.stdout.buffer.write(data)
+        sys.stdout.buffer.flush()
+
+    await server.serve_lines(read_lines(reader), write)
+
+
+async def run(args: argparse.Namespace) -> None:
+    await seed_orders()
+    await transcripts.start()
+    server = SessionServer(
+        SessionManager(max_sessions=args.max_sessions, idle_timeout=args.idle_timeout, max_waiting=args.max_waiting)
+    )
+    sweeper = asyncio.create_task(server.sweep())
+    try:
+        if args.stdio:
+            await serve_stdio(server)
+        else:
+            await serve_tcp(server, args.host, args.port)
+    finally:
+        sweeper.cancel()
+        logger.info(f"Session server stopped, {server.stats()}")
+        order_store.close()
+        await transcripts.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="TechGadgets support session server")
+    parser.add_argument("--stdio", action="store_true", help="speak JSON lines on stdin/stdout instead of TCP")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=int(os.getenv("SUPPORT_SERVER_PORT", "8765")))
+    parser.add_argument("--max-sessions", type=int, default=int(os.getenv("SUPPORT_MAX_SESSIONS", "10000")))
+    parser.add_argument("--idle-timeout", type=float, default=float(os.getenv("SUPPORT_IDLE_TIMEOUT", "1800")))
+    parser.add_argument("--max-waiting", type=int, default=4, help="queued messages allowed per session")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
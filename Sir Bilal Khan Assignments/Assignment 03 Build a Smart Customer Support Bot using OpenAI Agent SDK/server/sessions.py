@@ -0,0 +1,116 @@
+# server/sessions.py
+import asyncio
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from typing import Literal
+
+# Lines of recent conversation kept per session; the full transcript is on disk
+HISTORY_TAIL = 20
+
+
+@dataclass
+class SupportSession:
+    """One customer's conversation: its history and which agent is currently talking to them"""
+    session_id: str
+    history: deque[str] = field(default_factory=lambda: deque(maxlen=HISTORY_TAIL))
+    agent: Literal["bot", "human"] = "bot"
+    turns: int = 0
+    last_seen: float = field(default_factory=time.monotonic)
+    # Turns of one session run one after another so its history stays in order
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock, repr=False)
+    waiting: int = 0
+
+
+class SessionBusy(Exception):
+    pass
+
+
+class SessionManager:
+    """Sessions by id, least recently used first, capped at `max_sessions` and `idle_timeout` seconds idle"""
+
+    def __init__(self, max_sessions: int = 10_000, idle_timeout: float = 1800.0, max_waiting: int = 4):
+        self.max_sessions = max_sessions
+        self.idle_timeout = idle_timeout
+        self.max_waiting = max_waiting
+        self._sessions: OrderedDict[str, SupportSession] = OrderedDict()
+
+        self.created = 0
+        self.evicted = 0
+        self.turns = 0
+        self.rejected = 0
+        self.in_flight = 0
+        self.started = time.monotonic()
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def get(self, session_id: str) -> SupportSession:
+        session = self._sessions.get(session_id)
+        if session is None:
+            session = self._sessions[session_id] = SupportSession(session_id)
+            self.created += 1
+            self._evict_over_capacity()
+        else:
+            self._sessions.move_to_end(session_id)
+        session.last_seen = time.monotonic()
+        return session
+
+    async def run_turn(self, session_id: str, handler, message: str):
+        """Run `handler(session, message)` with the session's lock held, queueing at most `max_waiting` turns"""
+        session = self.get(session_id)
+        if session.waiting >= self.max_waiting:
+            self.rejected += 1
+            raise SessionBusy(f"Session {session_id} already has {session.waiting} messages waiting")
+
+        session.waiting += 1
+        try:
+            async with session.lock:
+                self.in_flight += 1
+                try:
+                    return await handler(session, message)
+                finally:
+                    self.in_flight -= 1
+                    session.turns += 1
+                    session.last_seen = time.monotonic()
+                    self.turns += 1
+        finally:
+            session.waiting -= 1
+
+    def end(self, session_id: str) -> SupportSession | None:
+        return self._sessions.pop(session_id, None)
+
+    def evict_idle(self) -> list[SupportSession]:
+        """Drop sessions idle longer than `idle_timeout`, oldest first, and return them"""
+        cutoff = time.monotonic() - self.idle_timeout
+        evicted = []
+        for session in list(self._sessions.values()):
+            if session.last_seen >= cutoff:
+                break
+            if session.waiting:
+                continue
+            evicted.append(self._sessions.pop(session.session_id))
+        self.evicted += len(evicted)
+        return evicted
+
+    def stats(self) -> dict:
+        uptime = time.monotonic() - self.started
+        return {
+            "active_sessions": len(self._sessions),
+            "created": self.created,
+            "evicted": self.evicted,
+            "turns": self.turns,
+            "in_flight": self.in_flight,
+            "rejected": self.rejected,
+            "turns_per_s": round(self.turns / uptime, 2) if uptime else 0.0,
+        }
+
+    def _evict_over_capacity(self) -> None:
+        # Least recently used sessions go first; ones with a turn still running are skipped
+        for session in list(self._sessions.values()):
+            if len(self._sessions) <= self.max_sessions:
+                break
+            if session.waiting:
+                continue
+            del self._sessions[session.session_id]
+            self.evicted += 1
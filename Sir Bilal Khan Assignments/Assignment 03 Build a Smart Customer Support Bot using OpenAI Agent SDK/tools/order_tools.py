@@ -1,21 +1,17 @@
 from openai import function_tool
+from analysis.turn_features import features_for
+from orders.order_db import order_store
 import random
 
-# Mock order database
-ORDERS = {
-    "123": "Shipped",
-    "456": "Processing",
-    "789": "Delivered"
-}
-
 @function_tool(
     name="get_order_status",
     description="Fetch the status of a customer's order by order_id",
-    is_enabled=lambda query: "order" in query.lower(),   # only enabled when 'order' mentioned
+    is_enabled=lambda query: features_for(query).has("order"),   # only enabled when an order word is mentioned
     error_function=lambda e: f"Sorry, couldn't fetch order. Error: {str(e)}"
 )
-def get_order_status(order_id: str) -> str:
-    """Simulates fetching order status"""
-    if order_id not in ORDERS:
+async def get_order_status(order_id: str) -> str:
+    """Fetches order status from the order store"""
+    order = await order_store.get(order_id)
+    if order is None:
         raise ValueError("Order ID not found. Please check and try again.")
-    return f"Order {order_id} is currently {ORDERS[order_id]}."
+    return f"Order {order_id} is currently {order['status']}."
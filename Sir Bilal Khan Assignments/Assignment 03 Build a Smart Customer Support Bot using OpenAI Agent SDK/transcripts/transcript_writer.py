@@ -0,0 +1,165 @@
+# transcripts/transcript_writer.py
+import asyncio
+import gzip
+import json
+import os
+import shutil
+import threading
+import time
+from collections import deque
+from pathlib import Path
+
+
+class TranscriptWriter:
+    """Append-only JSONL transcript, one record per turn, written in the background.
+
+    `write()` only appends to an in-memory buffer; a background task writes the buffer out every
+    `flush_interval` seconds (or sooner when `max_buffer` records are waiting), so a crash loses at
+    most that much. The active file rolls over to a timestamped name once it reaches `max_bytes`
+    or `max_age` seconds, and rolled files are gzipped when `compress` is set. The last `tail_size`
+    records stay in memory for anyone who needs recent context.
+    """
+
+    ACTIVE_NAME = "transcript.jsonl"
+
+    def __init__(
+        self,
+        directory: str,
+        max_bytes: int = 50_000_000,
+        max_age: float = 86_400.0,
+        compress: bool = True,
+        flush_interval: float = 1.0,
+        max_buffer: int = 1000,
+        tail_size: int = 200,
+    ):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self.compress = compress
+        self.flush_interval = flush_interval
+        self.max_buffer = max_buffer
+
+        self._buffer: list[str] = []
+        self._recent: deque[dict] = deque(maxlen=tail_size)
+        self._wake = asyncio.Event()
+        self._task: asyncio.Task | None = None
+        self._file = None
+        self._opened_at = 0.0
+        # A flush cancelled by close() can still be writing in its thread when the final flush starts
+        self._file_lock = threading.Lock()
+
+        self.records = 0
+        self.flushes = 0
+        self.rotations = 0
+        self.bytes_written = 0
+
+    @property
+    def active_path(self) -> Path:
+        return self.directory / self.ACTIVE_NAME
+
+    async def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    def write(self, record: dict) -> None:
+        record.setdefault("ts", round(time.time(), 3))
+        self._recent.append(record)
+        self._buffer.append(json.dumps(record, ensure_ascii=False) + "\n")
+        self.records += 1
+        if len(self._buffer) >= self.max_buffer:
+            self._wake.set()
+
+    def tail(self, limit: int | None = None, session_id: str | None = None) -> list[dict]:
+        """The most recent records, oldest first, optionally only one session's"""
+        records = [r for r in self._recent if session_id is None or r.get("session_id") == session_id]
+        return records[-limit:] if limit else records
+
+    async def flush(self) -> None:
+        lines, self._buffer = self._buffer, []
+        if lines:
+            await asyncio.to_thread(self._write_lines, lines)
+
+    async def close(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+        with self._file_lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def stats(self) -> dict:
+        return {
+            "records": self.records,
+            "buffered": len(self._buffer),
+            "flushes": self.flushes,
+            "rotations": self.rotations,
+            "bytes_written": self.bytes_written,
+        }
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+            await self.flush()
+
+    def _write_lines(self, lines: list[str]) -> None:
+        # Runs in a worker thread
+        with self._file_lock:
+            self._write_locked(lines)
+
+    def _write_locked(self, lines: list[str]) -> None:
+        if self._file is None:
+            self._open()
+        if self._should_rotate():
+            self._rotate()
+            self._open()
+
+        data = "".join(lines)
+        self._file.write(data)
+        self._file.flush()
+        self.flushes += 1
+        self.bytes_written += len(data)
+
+    def _open(self) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.active_path, "a", encoding="utf-8")
+        # An existing file is continued; its age counts from its first record, since the
+        # filesystem has no reliable creation time (ctime changes on every append)
+        self._opened_at = self._first_record_time() if self._file.tell() else time.time()
+
+    def _first_record_time(self) -> float:
+        with open(self.active_path, encoding="utf-8") as existing:
+            first = existing.readline()
+        try:
+            return float(json.loads(first)["ts"])
+        except (ValueError, KeyError, TypeError):
+            # Unreadable first record: treat the file as old enough to roll over
+            return 0.0
+
+    def _should_rotate(self) -> bool:
+        return self._file.tell() >= self.max_bytes or time.time() - self._opened_at >= self.max_age
+
+    def _rotate(self) -> None:
+        self._file.close()
+        self._file = None
+        stamp = time.strftime("%Y%m%d-%H%M%S")
+        target = self.directory / f"transcript-{stamp}.jsonl"
+        suffix = 1
+        while target.exists() or target.with_suffix(".jsonl.gz").exists():
+            target = self.directory / f"transcript-{stamp}-{suffix}.jsonl"
+            suffix += 1
+        os.replace(self.active_path, target)
+        if self.compress:
+            with open(target, "rb") as source, gzip.open(f"{target}.gz", "wb") as compressed:
+                shutil.copyfileobj(source, compressed)
+            target.unlink()
+        self.rotations += 1
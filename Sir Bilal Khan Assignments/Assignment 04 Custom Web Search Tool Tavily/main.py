@@ -1,10 +1,40 @@
 import asyncio
+import time
 from my_agent.Assistant_agent import agent
+from websearchtool.http_session import http_sessions
+from websearchtool.tavilytool import search_cache, search_control, search_flights
 
 async def main():
     query = "current president of the Srilanka?"
-    result = await agent.run(query)
-    print(result)
+    async with agent:
+        started = time.perf_counter()
+        result = await agent.run(query)
+        print(result)
+        print(f"\nFirst search: {time.perf_counter() - started:.2f}s")
+
+        # Same connection, no handshake this time
+        started = time.perf_counter()
+        await agent.run("prime minister of Srilanka?")
+        print(f"Second search: {time.perf_counter() - started:.2f}s")
+        print(f"Connections: {http_sessions.stats.summary()}")
+
+        # Asked again with different spelling: answered from the search cache
+        started = time.perf_counter()
+        await agent.run("Current President of the Srilanka")
+        print(f"Repeated search: {time.perf_counter() - started:.3f}s")
+        print(f"Search cache: {search_cache.stats()}")
+        print(f"Single-flight: {search_flights.stats()}")
+
+        # Research question split into sub-queries, searched at the same time
+        started = time.perf_counter()
+        result = await agent.run([
+            "Srilanka president election results",
+            "Srilanka prime minister",
+            "Srilanka parliament 2024",
+        ])
+        print(result)
+        print(f"Fan-out search: {time.perf_counter() - started:.2f}s")
+        print(f"Latency control: {search_control.stats()}")
 
 if __name__ == "__main__":
     asyncio.run(main())
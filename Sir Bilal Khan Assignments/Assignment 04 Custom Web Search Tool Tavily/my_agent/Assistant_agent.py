@@ -1,14 +1,86 @@
+import asyncio
+from urllib.parse import urldefrag
+
+from decouple import config
 from websearchtool.tavilytool import WebSearchTool
 
+# Fan-out mode: how many sub-queries search at once, and how long each may take
+FANOUT_CONCURRENCY = config("FANOUT_CONCURRENCY", default=4, cast=int)
+FANOUT_TIMEOUT = config("FANOUT_TIMEOUT", default=10.0, cast=float)
+
+
+def url_key(url: str) -> str:
+    """Same key for URLs that only differ by fragment or trailing slash"""
+    return urldefrag(url)[0].rstrip("/").lower()
+
+
+def merge_results(result_lists: list[list[dict]]) -> list[dict]:
+    """One result per URL, keeping the best-scoring snippet, best first"""
+    best: dict[str, dict] = {}
+    for results in result_lists:
+        for result in results:
+            key = url_key(result.get("url", ""))
+            current = best.get(key)
+            if current is None or result.get("score", 0) > current.get("score", 0):
+                best[key] = result
+    return sorted(best.values(), key=lambda result: result.get("score", 0), reverse=True)
+
+
 class GeminiAgent:
     def __init__(self, tools):
         self.tools = {tool.name: tool for tool in tools}
 
-    async def run(self, prompt: str):
+    async def start(self):
+        """Run every tool's startup hook, e.g. opening connection pools"""
+        for tool in self.tools.values():
+            await tool.start()
+
+    async def close(self):
+        for tool in self.tools.values():
+            await tool.close()
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def run(self, prompt: str | list[str]):
+        """Search for a prompt, or for a list of sub-queries at once (fan-out mode)"""
+        if isinstance(prompt, list):
+            return await self.fan_out(prompt)
         tool = self.tools.get("web_search")
         if tool:
             return await tool.run(prompt)
         return f"Agent Response: I got your prompt: '{prompt}'"
 
+    async def fan_out(
+        self, queries: list[str], concurrency: int = FANOUT_CONCURRENCY, timeout: float = FANOUT_TIMEOUT
+    ) -> str:
+        """Run all sub-queries concurrently and merge their results, de-duplicated by URL.
+
+        Takes about as long as the slowest search instead of the sum of them. A sub-query
+        that fails or takes longer than `timeout` is left out instead of failing the rest.
+        """
+        tool = self.tools.get("web_search")
+        if tool is None or tool.search is None:
+            return f"Agent Response: I got your prompt: '{queries}'"
+
+        slots = asyncio.Semaphore(concurrency)
+
+        async def one(query: str) -> list[dict]:
+            async with slots:
+                return await asyncio.wait_for(tool.search(query), timeout)
+
+        outcomes = await asyncio.gather(*(one(query) for query in queries), return_exceptions=True)
+        result_lists = [outcome for outcome in outcomes if not isinstance(outcome, BaseException)]
+        text = tool.format(merge_results(result_lists))
+
+        failed = len(queries) - len(result_lists)
+        if failed:
+            text += f"\n\n({failed} of {len(queries)} searches failed or timed out)"
+        return text
+
 
 agent = GeminiAgent(tools=[WebSearchTool])
@@ -1,5 +1,8 @@
+import os
 from agents import Agent
 from gemini_config.connections import MODEL
+from my_agent.local_router import LocalRouter
+from my_agent.routing_examples import ROUTING_EXAMPLES
 
 islamic = Agent(
     name = "Islamic Scholar",
@@ -18,4 +21,20 @@ triagent = Agent(
     instructions = "You are a respectful and knowledgeable religious scholar who can provide accurate answers about both Islam and Christianity. When asked a question, determine whether it pertains to Islam or Christianity and respond accordingly. If the question is ambiguous or could relate to both religions, provide a balanced perspective that respects both faiths. Always ensure your responses are respectful and considerate of the beliefs and practices of both religions.",
     model=MODEL,
     handoffs=[islamic, chiristian],
-)
\ No newline at end of file
+)
+
+# Clear questions skip the triage turn and go straight to the specialist
+local_router = LocalRouter(
+    ROUTING_EXAMPLES,
+    min_similarity=float(os.getenv("ROUTER_MIN_SIMILARITY", "0.1")),
+    min_margin=float(os.getenv("ROUTER_MIN_MARGIN", "0.08")),
+)
+
+specialists = {
+    "islam": islamic,
+    "christianity": chiristian,
+}
+
+def route(question: str) -> Agent:
+    """Specialist agent for a clearly classifiable question, triagent (LLM triage) otherwise"""
+    return specialists.get(local_router.route(question), triagent)
\ No newline at end of file
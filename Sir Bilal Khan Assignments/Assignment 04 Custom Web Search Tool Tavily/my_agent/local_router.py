@@ -0,0 +1,92 @@
+import math
+import re
+from collections import Counter, defaultdict
+
+TOKEN_RE = re.compile(r"[a-z']+")
+
+# Question words and fillers appear in every class and only blur the centroids
+STOP_WORDS = {
+    "a", "about", "an", "and", "are", "at", "be", "by", "can", "did", "do", "doe", "for", "from",
+    "has", "have", "how", "i", "in", "is", "it", "me", "of", "on", "or", "say", "tell", "that",
+    "the", "thi", "to", "was", "were", "what", "when", "where", "which", "who", "why", "with", "you",
+}
+
+
+def tokenize(text: str) -> list[str]:
+    tokens = []
+    for token in TOKEN_RE.findall(text.lower()):
+        token = token.strip("'")
+        # Crude plural folding so "muslims" and "muslim" share a feature
+        if len(token) > 3 and token.endswith("s") and not token.endswith("ss"):
+            token = token[:-1]
+        if token and token not in STOP_WORDS:
+            tokens.append(token)
+    return tokens
+
+
+class LocalRouter:
+    """TF-IDF nearest-centroid classifier that routes clear questions without an LLM turn.
+
+    `route()` returns a label only when the best class is similar enough to the question
+    and clearly ahead of the runner-up; otherwise it returns None and the caller should
+    fall back to LLM triage.
+    """
+
+    def __init__(self, examples: list[tuple[str, str]], min_similarity: float = 0.1, min_margin: float = 0.08):
+        self.min_similarity = min_similarity
+        self.min_margin = min_margin
+
+        documents = [(Counter(tokenize(text)), label) for text, label in examples]
+        document_frequency = Counter(token for counts, _ in documents for token in counts)
+        self.idf = {
+            token: math.log((1 + len(documents)) / (1 + df)) + 1 for token, df in document_frequency.items()
+        }
+
+        sums: dict[str, dict[str, float]] = defaultdict(lambda: defaultdict(float))
+        for counts, label in documents:
+            for token, weight in self._vector(counts).items():
+                sums[label][token] += weight
+        self.centroids = {label: self._normalize(vector) for label, vector in sums.items()}
+
+        self.routed: Counter[str] = Counter()
+        self.fallbacks = 0
+
+    def scores(self, text: str) -> dict[str, float]:
+        vector = self._normalize(self._vector(Counter(tokenize(text))))
+        return {
+            label: sum(weight * centroid.get(token, 0.0) for token, weight in vector.items())
+            for label, centroid in self.centroids.items()
+        }
+
+    def route(self, text: str) -> str | None:
+        ranked = sorted(self.scores(text).items(), key=lambda item: item[1], reverse=True)
+        best_label, best = ranked[0]
+        runner_up = ranked[1][1] if len(ranked) > 1 else 0.0
+
+        if best >= self.min_similarity and best - runner_up >= self.min_margin:
+            self.routed[best_label] += 1
+            return best_label
+
+        self.fallbacks += 1
+        return None
+
+    def stats(self) -> dict[str, object]:
+        routed = sum(self.routed.values())
+        total = routed + self.fallbacks
+        return {
+            "total": total,
+            "routed": dict(self.routed),
+            "fallbacks": self.fallbacks,
+            "hit_rate": routed / total if total else 0.0,
+        }
+
+    def _vector(self, counts: Counter) -> dict[str, float]:
+        # Unknown tokens carry no signal for any class, so they are dropped
+        return {token: count * self.idf[token] for token, count in counts.items() if token in self.idf}
+
+    @staticmethod
+    def _normalize(vector: dict[str, float]) -> dict[str, float]:
+        norm = math.sqrt(sum(weight * weight for weight in vector.values()))
+        if not norm:
+            return {}
+        return {token: weight / norm for token, weight in vector.items()}
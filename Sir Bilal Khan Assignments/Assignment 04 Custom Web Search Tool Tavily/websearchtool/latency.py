@@ -0,0 +1,202 @@
+# websearchtool/latency.py
+import asyncio
+import random
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable
+
+# Until this many calls have been timed, the defaults are used instead of the measured percentiles
+MIN_SAMPLES = 20
+
+
+class CircuitOpenError(Exception):
+    pass
+
+
+class LatencyTracker:
+    """Rolling window of the most recent call latencies"""
+
+    def __init__(self, window: int = 500):
+        self._samples: deque[float] = deque(maxlen=window)
+
+    def add(self, seconds: float) -> None:
+        self._samples.append(seconds)
+
+    def percentile(self, q: float) -> float | None:
+        if len(self._samples) < MIN_SAMPLES:
+            return None
+        ordered = sorted(self._samples)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+class CircuitBreaker:
+    """Fails fast after `threshold` failures in a row, then lets one trial call through every `reset_after` seconds"""
+
+    def __init__(self, threshold: int = 5, reset_after: float = 30.0):
+        self.threshold = threshold
+        self.reset_after = reset_after
+        self.failures = 0
+        self.opened_at: float | None = None
+        self._trial = False
+        self.rejected = 0
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        if time.monotonic() - self.opened_at >= self.reset_after:
+            return "half-open"
+        return "open"
+
+    def check(self) -> None:
+        state = self.state
+        if state == "closed":
+            return
+        if state == "half-open" and not self._trial:
+            self._trial = True
+            return
+        self.rejected += 1
+        raise CircuitOpenError("Error: search is temporarily unavailable")
+
+    def success(self) -> None:
+        self.failures = 0
+        self.opened_at = None
+        self._trial = False
+
+    def failure(self) -> None:
+        self.failures += 1
+        if self._trial or self.failures >= self.threshold:
+            self.opened_at = time.monotonic()
+        self._trial = False
+
+    def abandon(self) -> None:
+        """The call was cancelled before it said anything about the upstream"""
+        self._trial = False
+
+
+class LatencyControl:
+    """Adaptive deadlines, hedged requests, retries with backoff and a circuit breaker around one call.
+
+    Each attempt gets a deadline of `deadline_factor` times the recent p99, clamped to
+    [min_timeout, max_timeout]. If the first request is still running at the recent p95, a
+    second identical one is sent; whichever answers first wins and the other is cancelled.
+    Errors `retryable` accepts (and timeouts) are retried with exponential backoff and jitter.
+    """
+
+    def __init__(
+        self,
+        retryable: Callable[[Exception], bool] = lambda ex: False,
+        retries: int = 2,
+        backoff: float = 0.2,
+        min_timeout: float = 2.0,
+        max_timeout: float = 15.0,
+        deadline_factor: float = 3.0,
+        breaker: CircuitBreaker | None = None,
+    ):
+        self.retryable = retryable
+        self.retries = retries
+        self.backoff = backoff
+        self.min_timeout = min_timeout
+        self.max_timeout = max_timeout
+        self.deadline_factor = deadline_factor
+        self.breaker = breaker or CircuitBreaker()
+        self.latency = LatencyTracker()
+
+        self.calls = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+        self.retried = 0
+        self.timeouts = 0
+
+    def deadline(self) -> float:
+        p99 = self.latency.percentile(0.99)
+        if p99 is None:
+            return self.max_timeout
+        return min(self.max_timeout, max(self.min_timeout, p99 * self.deadline_factor))
+
+    async def call(self, fn: Callable[[], Awaitable[Any]]) -> Any:
+        self.calls += 1
+        for attempt in range(self.retries + 1):
+            self.breaker.check()
+            try:
+                result = await self._hedged(fn)
+            except asyncio.CancelledError:
+                self.breaker.abandon()
+                raise
+            except (TimeoutError, asyncio.TimeoutError) as ex:
+                self.timeouts += 1
+                error = ex
+            except Exception as ex:
+                if not self.retryable(ex):
+                    # The upstream answered, just not with something worth retrying
+                    self.breaker.success()
+                    raise
+                error = ex
+            else:
+                self.breaker.success()
+                return result
+
+            self.breaker.failure()
+            if attempt == self.retries or self.breaker.state != "closed":
+                raise error
+            self.retried += 1
+            # Full jitter so callers that failed together don't retry together
+            await asyncio.sleep(random.uniform(0, self.backoff * 2 ** attempt))
+
+    def stats(self) -> dict:
+        def ms(q: float) -> float | None:
+            value = self.latency.percentile(q)
+            return None if value is None else round(value * 1000, 1)
+
+        return {
+            "calls": self.calls,
+            "p50_ms": ms(0.5),
+            "p95_ms": ms(0.95),
+            "p99_ms": ms(0.99),
+            "deadline_s": round(self.deadline(), 2),
+            "hedges": self.hedges,
+            "hedge_wins": self.hedge_wins,
+            "retries": self.retried,
+            "timeouts": self.timeouts,
+            "circuit": self.breaker.state,
+            "rejected": self.breaker.rejected,
+        }
+
+    async def _hedged(self, fn: Callable[[], Awaitable[Any]]) -> Any:
+        started = time.perf_counter()
+        deadline = self.deadline()
+        hedge_after = self.latency.percentile(0.95)
+        first = asyncio.create_task(fn())
+        tasks = [first]
+        try:
+            if hedge_after is not None and hedge_after < deadline:
+                done, _ = await asyncio.wait(tasks, timeout=hedge_after)
+                if not done:
+                    self.hedges += 1
+                    tasks.append(asyncio.create_task(fn()))
+            pending = set(tasks)
+            while pending:
+                remaining = deadline - (time.perf_counter() - started)
+                done, pending = await asyncio.wait(
+                    pending, timeout=max(0.0, remaining), return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    # Counted at the deadline so a slow upstream pushes the deadlines up
+                    self.latency.add(deadline)
+                    raise TimeoutError(f"No response within {deadline:.2f}s")
+                for task in done:
+                    if task.exception() is None:
+                        self.latency.add(time.perf_counter() - started)
+                        if task is not first:
+                            self.hedge_wins += 1
+                        return task.result()
+                # One request failed; keep waiting on the other if it is still running
+                error = done.pop().exception()
+            raise error
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+                elif not task.cancelled():
+                    # Mark a losing request's error as seen
+                    task.exception()
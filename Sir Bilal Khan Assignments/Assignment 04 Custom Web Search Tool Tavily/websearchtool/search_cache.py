@@ -0,0 +1,177 @@
+# websearchtool/search_cache.py
+import asyncio
+import json
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+from typing import Awaitable, Callable
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS search_cache (
+    key TEXT PRIMARY KEY,
+    data TEXT NOT NULL,
+    stored_at REAL NOT NULL,
+    last_used REAL NOT NULL
+)
+"""
+
+# Eviction needs a COUNT(*), so it is only checked every this many writes
+EVICT_EVERY = 50
+# Hits only note last_used in memory; it reaches the database in one batch every this many hits
+TOUCH_FLUSH_EVERY = 100
+
+
+def normalize_query(query: str) -> str:
+    """Same key for queries that only differ in case, spacing or trailing punctuation"""
+    query = unicodedata.normalize("NFKC", query).casefold()
+    query = re.sub(r"\s+", " ", query).strip()
+    return query.rstrip("?!.").strip()
+
+
+def cache_key(query: str, search_depth: str, max_results: int) -> str:
+    return f"{search_depth}|{max_results}|{normalize_query(query)}"
+
+
+class SearchCache:
+    """SQLite cache of search responses with a TTL and stale-while-revalidate.
+
+    Entries younger than `ttl` are served as is. Entries up to `stale_ttl` seconds past that are
+    served immediately too, while one background refresh replaces them. Anything older is fetched
+    again before answering. At most `max_entries` are kept, least recently used go first.
+    """
+
+    def __init__(self, path: str, ttl: float = 3600.0, stale_ttl: float = 86_400.0, max_entries: int = 10_000):
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.max_entries = max_entries
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(SCHEMA)
+        self._db.commit()
+        self._lock = threading.Lock()
+        self._refreshing: dict[str, asyncio.Task] = {}
+        self._writes = 0
+        self._touched: dict[str, float] = {}
+
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.refreshes = 0
+        self.saved_latency = 0.0
+        # Moving average of what a real fetch costs, to estimate the time each hit saved
+        self.fetch_latency = 0.0
+
+    async def get_or_fetch(
+        self,
+        query: str,
+        search_depth: str,
+        max_results: int,
+        fetch: Callable[[], Awaitable[dict]],
+    ) -> dict:
+        key = cache_key(query, search_depth, max_results)
+        started = time.perf_counter()
+        entry = await asyncio.to_thread(self._read, key)
+
+        if entry is not None:
+            data, age = entry
+            if age < self.ttl:
+                self.hits += 1
+                self._saved(started)
+                return data
+            if age < self.ttl + self.stale_ttl:
+                self.stale_hits += 1
+                self._saved(started)
+                if key not in self._refreshing:
+                    task = asyncio.create_task(self._refresh(key, fetch))
+                    self._refreshing[key] = task
+                    task.add_done_callback(lambda _: self._refreshing.pop(key, None))
+                return data
+
+        self.misses += 1
+        return await self._fetch_and_store(key, fetch)
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.stale_hits + self.misses
+        return {
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "hit_ratio": round((self.hits + self.stale_hits) / lookups, 3) if lookups else 0.0,
+            "refreshes": self.refreshes,
+            "saved_latency_s": round(self.saved_latency, 3),
+        }
+
+    async def close(self) -> None:
+        for task in list(self._refreshing.values()):
+            task.cancel()
+        await asyncio.to_thread(self._close)
+
+    async def _refresh(self, key: str, fetch: Callable[[], Awaitable[dict]]) -> None:
+        try:
+            await self._fetch_and_store(key, fetch)
+            self.refreshes += 1
+        except Exception:
+            # Keep serving the stale entry; the next lookup will try again
+            pass
+
+    async def _fetch_and_store(self, key: str, fetch: Callable[[], Awaitable[dict]]) -> dict:
+        started = time.perf_counter()
+        data = await fetch()
+        elapsed = time.perf_counter() - started
+        self.fetch_latency = elapsed if not self.fetch_latency else 0.8 * self.fetch_latency + 0.2 * elapsed
+        await asyncio.to_thread(self._write, key, data)
+        return data
+
+    def _saved(self, started: float) -> None:
+        self.saved_latency += max(0.0, self.fetch_latency - (time.perf_counter() - started))
+
+    def _read(self, key: str) -> tuple[dict, float] | None:
+        with self._lock:
+            row = self._db.execute("SELECT data, stored_at FROM search_cache WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            now = time.time()
+            self._touched[key] = now
+            if len(self._touched) >= TOUCH_FLUSH_EVERY:
+                self._flush_touches()
+                self._db.commit()
+        return json.loads(row[0]), now - row[1]
+
+    def _write(self, key: str, data: dict) -> None:
+        now = time.time()
+        with self._lock:
+            self._touched.pop(key, None)
+            self._db.execute(
+                "INSERT OR REPLACE INTO search_cache (key, data, stored_at, last_used) VALUES (?, ?, ?, ?)",
+                (key, json.dumps(data), now, now),
+            )
+            self._writes += 1
+            if self._writes % EVICT_EVERY == 0:
+                self._evict()
+            self._db.commit()
+
+    def _flush_touches(self) -> None:
+        if self._touched:
+            self._db.executemany(
+                "UPDATE search_cache SET last_used = ? WHERE key = ?",
+                [(used, key) for key, used in self._touched.items()],
+            )
+            self._touched.clear()
+
+    def _evict(self) -> None:
+        # Eviction goes by last_used, so it has to see the latest hits
+        self._flush_touches()
+        count = self._db.execute("SELECT COUNT(*) FROM search_cache").fetchone()[0]
+        if count > self.max_entries:
+            self._db.execute(
+                "DELETE FROM search_cache WHERE key IN (SELECT key FROM search_cache ORDER BY last_used LIMIT ?)",
+                (count - self.max_entries,),
+            )
+
+    def _close(self) -> None:
+        with self._lock:
+            self._flush_touches()
+            self._db.commit()
+            self._db.close()
@@ -0,0 +1,42 @@
+# websearchtool/single_flight.py
+import asyncio
+from typing import Any, Awaitable, Callable
+
+
+class SingleFlight:
+    """Runs at most one call per key at a time; concurrent callers with the same key share it.
+
+    The shared call runs as its own task, so one waiter being cancelled doesn't cancel it for
+    the others. Its result, or its exception, is handed to every waiter.
+    """
+
+    def __init__(self):
+        self._inflight: dict[str, asyncio.Task] = {}
+        self.calls = 0
+        self.shared = 0
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        self.calls += 1
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._forget(key, task))
+        else:
+            self.shared += 1
+        return await asyncio.shield(task)
+
+    def stats(self) -> dict:
+        return {
+            "calls": self.calls,
+            "upstream_calls": self.calls - self.shared,
+            "saved_upstream_calls": self.shared,
+            "in_flight": len(self._inflight),
+        }
+
+    def _forget(self, key: str, task: asyncio.Task) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # Mark the exception as seen in case every waiter was cancelled before it arrived
+        if not task.cancelled():
+            task.exception()
@@ -1,34 +1,118 @@
 import aiohttp
 from decouple import config
+from websearchtool.http_session import http_sessions
+from websearchtool.latency import CircuitBreaker, CircuitOpenError, LatencyControl
+from websearchtool.search_cache import SearchCache, cache_key
+from websearchtool.single_flight import SingleFlight
 
 TAVILY_API_KEY = config("TAVILY_API_KEY")
+TAVILY_URL = config("TAVILY_URL", default="https://api.tavily.com/search")
+
+search_cache = SearchCache(
+    config("SEARCH_CACHE_PATH", default="search_cache.db"),
+    ttl=config("SEARCH_CACHE_TTL", default=3600.0, cast=float),
+    stale_ttl=config("SEARCH_CACHE_STALE_TTL", default=86400.0, cast=float),
+    max_entries=config("SEARCH_CACHE_SIZE", default=10000, cast=int),
+)
+# Sessions asking the same thing at the same moment share one upstream request
+search_flights = SingleFlight()
+
+
+class SearchError(Exception):
+    def __init__(self, status: int):
+        super().__init__(f"Error: {status}")
+        self.status = status
+
+
+def is_retryable(ex: Exception) -> bool:
+    # Connection resets, DNS failures and refused connections mean a degraded upstream too
+    if isinstance(ex, (aiohttp.ClientError, OSError)):
+        return True
+    return isinstance(ex, SearchError) and (ex.status == 429 or ex.status >= 500)
+
+
+# Deadlines, hedging, retries and the circuit breaker for every request sent to Tavily
+search_control = LatencyControl(
+    retryable=is_retryable,
+    retries=config("SEARCH_RETRIES", default=2, cast=int),
+    backoff=config("SEARCH_BACKOFF", default=0.2, cast=float),
+    min_timeout=config("SEARCH_TIMEOUT_MIN", default=2.0, cast=float),
+    max_timeout=config("SEARCH_TIMEOUT_MAX", default=15.0, cast=float),
+    breaker=CircuitBreaker(
+        threshold=config("SEARCH_BREAKER_THRESHOLD", default=5, cast=int),
+        reset_after=config("SEARCH_BREAKER_RESET", default=30.0, cast=float),
+    ),
+)
 
 
 class Tool:
-    def __init__(self, name: str, description: str, func):
+    def __init__(self, name: str, description: str, func, startup=None, shutdown=None, search=None, format=None):
         self.name = name
         self.description = description
         self.func = func
+        # Optional raw search (query -> list of result dicts) and its formatter, for the agent's fan-out mode
+        self.search = search
+        self.format = format
+        # Optional async hooks, awaited once when the agent starts and when it shuts down
+        self.startup = startup
+        self.shutdown = shutdown
+
+    async def start(self):
+        if self.startup:
+            await self.startup()
+
+    async def close(self):
+        if self.shutdown:
+            await self.shutdown()
 
     async def run(self, *args, **kwargs):
         return await self.func(*args, **kwargs)
 
 
-async def web_search_tool(query: str) -> str:
-    url = "https://api.tavily.com/search"
+async def search_tavily(query: str, search_depth: str = "basic", max_results: int = 5) -> dict:
+    """One POST to the Tavily API, returning its JSON response"""
+    url = TAVILY_URL
     headers = {
         "Content-Type": "application/json",
         "Authorization": f"Bearer {TAVILY_API_KEY}"
     }
-    payload = {"query": query, "search_depth": "basic", "max_results": 5}
+    payload = {"query": query, "search_depth": search_depth, "max_results": max_results}
 
-    async with aiohttp.ClientSession() as session:
-        async with session.post(url, json=payload, headers=headers) as response:
-            if response.status != 200:
-                return f"Error: {response.status}"
-            data = await response.json()
+    # Shared keep-alive session: after the first search, no new TCP/TLS handshake or DNS lookup
+    session = await http_sessions.get()
+    async with session.post(url, json=payload, headers=headers) as response:
+        if response.status != 200:
+            raise SearchError(response.status)
+        return await response.json()
 
-    results = data.get("results", [])
+
+async def search(query: str, search_depth: str = "basic", max_results: int = 5) -> list[dict]:
+    """Tavily results for a query, served from the search cache when possible"""
+    key = cache_key(query, search_depth, max_results)
+    data = await search_cache.get_or_fetch(
+        query,
+        search_depth,
+        max_results,
+        lambda: search_flights.do(
+            key, lambda: search_control.call(lambda: search_tavily(query, search_depth, max_results))
+        ),
+    )
+    return data.get("results", [])
+
+
+async def web_search_tool(query: str) -> str:
+    try:
+        results = await search(query)
+    except (SearchError, CircuitOpenError) as ex:
+        return str(ex)
+    except TimeoutError:
+        return "Error: search timed out"
+    except aiohttp.ClientError as ex:
+        return f"Error: could not reach the search service ({ex.__class__.__name__})"
+    return format_results(results)
+
+
+def format_results(results: list[dict]) -> str:
     if not results:
         return "No results found."
 
@@ -37,8 +121,21 @@ async def web_search_tool(query: str) -> str:
     )
 
 
+async def open_search_session():
+    await http_sessions.get()
+
+
+async def close_search():
+    await search_cache.close()
+    await http_sessions.close()
+
+
 WebSearchTool = Tool(
     name="web_search",
     description="Search the web using Tavily API",
-    func=web_search_tool
+    func=web_search_tool,
+    startup=open_search_session,
+    shutdown=close_search,
+    search=search,
+    format=format_results,
 )
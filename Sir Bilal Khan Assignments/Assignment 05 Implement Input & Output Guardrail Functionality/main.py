@@ -15,7 +15,9 @@ import logging
 from my_agents.weather_agent import weather_agent
 from my_agents.hotel_agent import hotel_agent
 from my_agents.flight_agent import flight_agent
+from my_agents.prompting import stable_instructions
 from my_config import model
+from model_client import instruction_stats
 from agents.extensions import handoff_filters
 
 import asyncio
@@ -233,7 +235,7 @@ def handoff_filter(data: HandoffInputData) -> HandoffInputData:
 # Enhanced triage agent with guardrails
 triage_agent = Agent(
     name="TriageAgent",
-    instructions="""
+    instructions=stable_instructions("""
     You are a triage agent. Your responsibilities:
     1. Analyze user queries and hand off to appropriate specialist agents
     2. Enforce content guidelines and compliance rules
@@ -246,7 +248,7 @@ triage_agent = Agent(
     - WeatherAgent: For weather-related queries (forecasts, conditions)
     
     For any queries involving sensitive information, politely decline and explain limitations.
-    """,
+    """),
     handoffs=[
         handoff(
             agent=weather_agent,
@@ -409,5 +411,8 @@ async def main():
             start_agent = triage_agent
             input_data = []
 
+    # How much of each agent's instructions the provider could serve from its prompt cache
+    logger.info(f"Instruction prefixes: {instruction_stats()}")
+
 if __name__ == "__main__":
     asyncio.run(main())
\ No newline at end of file
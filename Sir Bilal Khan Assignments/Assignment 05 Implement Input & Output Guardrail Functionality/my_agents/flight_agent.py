@@ -1,4 +1,5 @@
 from agents import Agent, function_tool
+from my_agents.prompting import stable_instructions
 from pydantic import BaseModel, Field
 from typing import Optional
 import logging
@@ -37,7 +38,7 @@ def find_flights(from_city: str, to_city: str, date: str) -> str:
 
 flight_agent = Agent(
     name="FlightAgent",
-    instructions="""
+    instructions=stable_instructions("""
     You are a flight agent specialized in finding flight information.
     
     Guidelines:
@@ -49,7 +50,7 @@ flight_agent = Agent(
     
     Use the find_flights tool for all flight searches.
     For queries outside your scope, hand off to the triage agent.
-    """,
+    """),
     handoff_description="Specialist agent for flight information and availability",
     tools=[find_flights],
 )
\ No newline at end of file
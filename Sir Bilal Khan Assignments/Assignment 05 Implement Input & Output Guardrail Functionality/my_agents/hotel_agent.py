@@ -1,4 +1,5 @@
 from agents import Agent, function_tool
+from my_agents.prompting import stable_instructions
 from pydantic import BaseModel, Field
 import logging
 
@@ -31,7 +32,7 @@ def find_hotels(city: str, date: str) -> str:
 
 hotel_agent = Agent(
     name="HotelAgent",
-    instructions="""
+    instructions=stable_instructions("""
     You are a hotel agent specialized in finding accommodation information.
     
     Guidelines:
@@ -43,7 +44,7 @@ hotel_agent = Agent(
     
     Use the find_hotels tool for all hotel searches.
     For queries outside your scope, hand off to the triage agent.
-    """,
+    """),
     handoff_description="Specialist agent for hotel information and availability",
     tools=[find_hotels],
 )
\ No newline at end of file
@@ -0,0 +1,21 @@
+from typing import Any
+
+from agents import Agent, RunContextWrapper
+from model_client import StableInstructions
+
+
+def user_profile(ctx: RunContextWrapper[Any], agent: Agent) -> str:
+    """Who the agent is talking to; the only part of the instructions that changes between users"""
+    user = ctx.context
+    if user is None:
+        return "Current user: unknown"
+    return f"Current user: {user.name} (role: {user.role})"
+
+
+def user_version(user: Any) -> tuple | None:
+    return None if user is None else (user.name, user.role)
+
+
+def stable_instructions(static: str) -> StableInstructions:
+    """Static agent instructions first, user details last, so every user shares the cached prompt prefix"""
+    return StableInstructions(static, dynamic=user_profile, version=user_version)
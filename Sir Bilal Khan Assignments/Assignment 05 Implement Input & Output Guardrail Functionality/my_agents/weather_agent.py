@@ -1,4 +1,5 @@
 from agents import Agent, function_tool
+from my_agents.prompting import stable_instructions
 from pydantic import BaseModel, Field
 import logging
 
@@ -35,7 +36,7 @@ def find_weather(city: str) -> str:
 
 weather_agent = Agent(
     name="WeatherAgent",
-    instructions="""
+    instructions=stable_instructions("""
     You are a weather agent specialized in providing weather information.
     
     Guidelines:
@@ -46,7 +47,7 @@ weather_agent = Agent(
     
     Use the find_weather tool for all weather queries.
     For queries outside your scope, hand off to the triage agent.
-    """,
+    """),
     handoff_description="Specialist agent for weather information and forecasts",
     tools=[find_weather],
 )
\ No newline at end of file
@@ -11,7 +11,7 @@ from agents import (
     RunConfig,
 )
 
-from openai import AsyncOpenAI
+from model_client import get_client, get_model
 from dotenv import load_dotenv, find_dotenv
 import os
 
@@ -27,10 +27,8 @@ model_name = os.getenv("OPENAI_MODEL_NAME1")
 
 set_tracing_export_api_key(str(api_key1))
 
-client = AsyncOpenAI(
-    api_key=api_key,
-    base_url=base_url,
-)
+# Shares one pooled keep-alive HTTP client with every other model in the process
+client = get_client(api_key=str(api_key), base_url=base_url)
 
-model = OpenAIChatCompletionsModel(model=str(model_name), openai_client=client)
+model = get_model(str(model_name), api_key=str(api_key), base_url=base_url)
 config = RunConfig(model=model)
\ No newline at end of file
@@ -0,0 +1,4 @@
+from model_client.factory import get_client, get_http_client, get_model, pool_stats
+from model_client.instructions import StableInstructions, instruction_stats
+
+__all__ = ["StableInstructions", "get_client", "get_http_client", "get_model", "instruction_stats", "pool_stats"]
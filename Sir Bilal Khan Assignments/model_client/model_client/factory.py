@@ -0,0 +1,53 @@
+# model_client/factory.py
+import importlib.util
+import os
+from typing import Any
+
+from agents import OpenAIChatCompletionsModel
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
+
+from model_client.pool import PooledTransport
+
+_transport: PooledTransport | None = None
+_http_client: DefaultAsyncHttpxClient | None = None
+_clients: dict[tuple[str, str | None], AsyncOpenAI] = {}
+
+
+def _http2_available() -> bool:
+    # httpx only speaks HTTP/2 when the optional `h2` package is installed
+    return importlib.util.find_spec("h2") is not None
+
+
+def get_http_client() -> DefaultAsyncHttpxClient:
+    """One keep-alive HTTP connection pool shared by every model client in the process"""
+    global _transport, _http_client
+    if _http_client is None:
+        http2 = os.getenv("MODEL_POOL_HTTP2", "auto")
+        _transport = PooledTransport(
+            max_connections=int(os.getenv("MODEL_POOL_MAX_CONNECTIONS", "100")),
+            max_keepalive_connections=int(os.getenv("MODEL_POOL_MAX_KEEPALIVE", "20")),
+            keepalive_expiry=float(os.getenv("MODEL_POOL_KEEPALIVE_EXPIRY", "30")),
+            per_endpoint_limit=int(os.getenv("MODEL_POOL_PER_ENDPOINT_LIMIT", "32")),
+            http2=_http2_available() if http2 == "auto" else http2 == "1",
+        )
+        _http_client = DefaultAsyncHttpxClient(transport=_transport)
+    return _http_client
+
+
+def get_client(api_key: str, base_url: str | None = None) -> AsyncOpenAI:
+    """AsyncOpenAI client for this key/endpoint, reusing the shared connection pool"""
+    key = (api_key, base_url)
+    if key not in _clients:
+        _clients[key] = AsyncOpenAI(api_key=api_key, base_url=base_url, http_client=get_http_client())
+    return _clients[key]
+
+
+def get_model(model: str, api_key: str, base_url: str | None = None) -> OpenAIChatCompletionsModel:
+    return OpenAIChatCompletionsModel(model=model, openai_client=get_client(api_key, base_url))
+
+
+def pool_stats() -> dict[str, Any]:
+    """Connections in use, waiting requests and wait times per endpoint, for sizing the pool"""
+    if _transport is None:
+        return {}
+    return _transport.stats()
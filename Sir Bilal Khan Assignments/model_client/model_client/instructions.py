@@ -0,0 +1,99 @@
+# model_client/instructions.py
+import textwrap
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Any, Callable
+
+from agents import Agent, RunContextWrapper
+
+# Between the static and the dynamic part; part of the cacheable prefix, so it never changes
+SEPARATOR = "\n\n"
+
+_renderers: list["StableInstructions"] = []
+
+
+def estimate_tokens(text: str) -> int:
+    return len(text) // 4
+
+
+class StableInstructions:
+    """Dynamic `instructions` for an Agent that keep the prompt prefix byte-identical across calls.
+
+    Provider prompt caches match on the longest shared prefix, so the static text goes first,
+    normalized once, and whatever depends on the run context is appended after it. When `version`
+    is given, the rendered text is memoized per (agent, version(context)) so unchanged contexts
+    skip `dynamic` entirely.
+    """
+
+    def __init__(
+        self,
+        static: str,
+        dynamic: Callable[[RunContextWrapper[Any], Agent[Any]], str] | None = None,
+        version: Callable[[Any], Hashable] | None = None,
+        max_entries: int = 256,
+    ):
+        self.static = textwrap.dedent(static).strip()
+        self.prefix = self.static + SEPARATOR if dynamic is not None else self.static
+        self.dynamic = dynamic
+        self.version = version
+        self.max_entries = max_entries
+        self._memo: OrderedDict[tuple[str, Hashable], str] = OrderedDict()
+        self._agents: dict[str, dict[str, int]] = {}
+
+        self.hits = 0
+        self.misses = 0
+        _renderers.append(self)
+
+    def __call__(self, ctx: RunContextWrapper[Any], agent: Agent[Any]) -> str:
+        key = None
+        if self.version is not None:
+            key = (agent.name, self.version(ctx.context))
+            text = self._memo.get(key)
+            if text is not None:
+                self._memo.move_to_end(key)
+                self.hits += 1
+                self._record(agent.name, text)
+                return text
+
+        self.misses += 1
+        text = self.render(ctx, agent)
+        if key is not None:
+            self._memo[key] = text
+            if len(self._memo) > self.max_entries:
+                self._memo.popitem(last=False)
+        self._record(agent.name, text)
+        return text
+
+    def render(self, ctx: RunContextWrapper[Any], agent: Agent[Any]) -> str:
+        if self.dynamic is None:
+            return self.prefix
+        return self.prefix + self.dynamic(ctx, agent)
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """Cacheable prefix length and average prompt size per agent that used these instructions"""
+        report = {}
+        for name, seen in self._agents.items():
+            average = seen["chars"] / seen["calls"]
+            report[name] = {
+                "calls": seen["calls"],
+                "cacheable_prefix_chars": len(self.prefix),
+                "cacheable_prefix_tokens": estimate_tokens(self.prefix),
+                "average_chars": round(average),
+                "cacheable_share": round(len(self.prefix) / average, 3) if average else 1.0,
+                "memo_hits": self.hits,
+                "memo_misses": self.misses,
+            }
+        return report
+
+    def _record(self, agent_name: str, text: str) -> None:
+        seen = self._agents.setdefault(agent_name, {"calls": 0, "chars": 0})
+        seen["calls"] += 1
+        seen["chars"] += len(text)
+
+
+def instruction_stats() -> dict[str, dict[str, Any]]:
+    """`StableInstructions.stats()` of every renderer in the process, keyed by agent name"""
+    report = {}
+    for renderer in _renderers:
+        report.update(renderer.stats())
+    return report
@@ -0,0 +1,121 @@
+# model_client/pool.py
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Any, Callable
+
+import httpx
+
+
+@dataclass
+class EndpointStats:
+    in_use: int = 0
+    waiting: int = 0
+    requests: int = 0
+    total_wait: float = 0.0
+    max_wait: float = 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "in_use": self.in_use,
+            "waiting": self.waiting,
+            "requests": self.requests,
+            "avg_wait_ms": self.total_wait / self.requests * 1000 if self.requests else 0.0,
+            "max_wait_ms": self.max_wait * 1000,
+        }
+
+
+class _ReleasingStream(httpx.AsyncByteStream):
+    """Response body that gives the endpoint slot back once it has been fully read or closed"""
+
+    def __init__(self, stream: httpx.AsyncByteStream, release: Callable[[], None]):
+        self._stream = stream
+        self._release = release
+
+    async def __aiter__(self):
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            self._release()
+
+
+class PooledTransport(httpx.AsyncBaseTransport):
+    """Keep-alive connection pool with a concurrency limit and wait-time stats per endpoint (host)"""
+
+    def __init__(
+        self,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 30.0,
+        per_endpoint_limit: int = 32,
+        http2: bool = False,
+    ):
+        self.per_endpoint_limit = per_endpoint_limit
+        self.http2 = http2
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self._transport = httpx.AsyncHTTPTransport(limits=self.limits, http2=http2)
+        self._semaphores: dict[str, asyncio.Semaphore] = {}
+        self.endpoints: dict[str, EndpointStats] = {}
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        host = request.url.host
+        semaphore = self._semaphores.get(host)
+        if semaphore is None:
+            semaphore = self._semaphores[host] = asyncio.Semaphore(self.per_endpoint_limit)
+            self.endpoints[host] = EndpointStats()
+        stats = self.endpoints[host]
+
+        stats.waiting += 1
+        started = time.perf_counter()
+        try:
+            await semaphore.acquire()
+        finally:
+            stats.waiting -= 1
+        waited = time.perf_counter() - started
+
+        stats.requests += 1
+        stats.total_wait += waited
+        stats.max_wait = max(stats.max_wait, waited)
+        stats.in_use += 1
+
+        released = False
+
+        def release() -> None:
+            nonlocal released
+            if not released:
+                released = True
+                stats.in_use -= 1
+                semaphore.release()
+
+        try:
+            response = await self._transport.handle_async_request(request)
+        except BaseException:
+            release()
+            raise
+
+        return httpx.Response(
+            status_code=response.status_code,
+            headers=response.headers,
+            stream=_ReleasingStream(response.stream, release),
+            extensions=response.extensions,
+        )
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "http2": self.http2,
+            "max_connections": self.limits.max_connections,
+            "max_keepalive_connections": self.limits.max_keepalive_connections,
+            "per_endpoint_limit": self.per_endpoint_limit,
+            "endpoints": {host: stats.as_dict() for host, stats in self.endpoints.items()},
+        }